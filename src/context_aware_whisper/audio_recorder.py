@@ -3,19 +3,20 @@ Audio Recorder Module
 Captures audio from microphone and stores in memory buffer.
 """
 
-import io
+import struct
 import threading
-from collections import deque
 from typing import Optional
 
 import numpy as np
 import sounddevice as sd
-from scipy.io import wavfile
 
 
 class AudioRecorder:
     """Records audio from microphone to memory buffer."""
 
+    # Seconds of audio held by each preallocated buffer segment
+    SEGMENT_SECONDS = 30
+
     def __init__(self, sample_rate: int = 16000, channels: int = 1):
         """
         Initialize audio recorder.
@@ -26,18 +27,84 @@ class AudioRecorder:
         """
         self.sample_rate = sample_rate
         self.channels = channels
-        self.buffer: deque = deque()
+        # Recorded int16 frames fill _segments in order, _write_pos in total.
+        # The stream callback only copies into segments that already exist;
+        # once it passes the high-water mark, a grower thread appends the next
+        # segment, so the realtime thread never allocates or moves audio.
+        self._segment_frames = sample_rate * self.SEGMENT_SECONDS
+        self._segments = [self._new_segment()]
+        self._write_pos = 0
         self._lock = threading.Lock()
+        self._grow_event = threading.Event()
+        self._grower: Optional[threading.Thread] = None
+        self._grower_stop = False
+
+        # 44-byte PCM int16 WAV header; only the two size fields (offsets 4
+        # and 40) change between recordings
+        block_align = channels * 2
+        self._wav_header = bytearray(
+            b'RIFF\0\0\0\0WAVEfmt '
+            + struct.pack('<IHHIIHH', 16, 1, channels, sample_rate,
+                          sample_rate * block_align, block_align, 16)
+            + b'data\0\0\0\0'
+        )
         self.stream: Optional[sd.InputStream] = None
         self._is_recording = False
 
+    def _new_segment(self) -> np.ndarray:
+        """Allocate one empty buffer segment."""
+        return np.empty((self._segment_frames, self.channels), dtype=np.int16)
+
     def _audio_callback(self, indata: np.ndarray, frames: int,
                         time_info, status) -> None:
-        """Callback for audio stream - appends chunks to buffer."""
+        """Callback for audio stream - copies the chunk onto the end of the buffer."""
         if status:
             print(f"Audio callback status: {status}")
+        segment_frames = self._segment_frames
         with self._lock:
-            self.buffer.append(indata.copy())
+            segments = self._segments
+            pos = self._write_pos
+            free = len(segments) * segment_frames - pos
+            n = indata.shape[0]
+            if n > free:
+                # The grower fell behind; keep what fits rather than allocate here
+                print(f"Audio buffer full, dropped {n - free} frames")
+                n = free
+            done = 0
+            while done < n:
+                index, offset = divmod(pos, segment_frames)
+                count = min(n - done, segment_frames - offset)
+                segments[index][offset:offset + count] = indata[done:done + count]
+                pos += count
+                done += count
+            self._write_pos = pos
+            if free - n < segment_frames // 2:
+                self._grow_event.set()
+
+    def _grow_segments(self) -> None:
+        """Grower thread: append a segment each time the callback asks for one."""
+        while True:
+            self._grow_event.wait()
+            self._grow_event.clear()
+            if self._grower_stop:
+                return
+            segment = self._new_segment()
+            with self._lock:
+                self._segments.append(segment)
+
+    def _start_grower(self) -> None:
+        """Start the grower thread; it must be running before any callback."""
+        self._grower_stop = False
+        self._grow_event.clear()
+        self._grower = threading.Thread(target=self._grow_segments, daemon=True)
+        self._grower.start()
+
+    def _stop_grower(self) -> None:
+        """Stop the grower thread and wait for it to exit."""
+        self._grower_stop = True
+        self._grow_event.set()
+        self._grower.join()
+        self._grower = None
 
     def start_recording(self) -> None:
         """Begin capturing audio from default input device."""
@@ -45,14 +112,21 @@ class AudioRecorder:
             return
 
         with self._lock:
-            self.buffer.clear()
+            self._write_pos = 0
+            # Hand back memory from an earlier long recording
+            del self._segments[1:]
         self.stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
             dtype='int16',
             callback=self._audio_callback
         )
-        self.stream.start()
+        self._start_grower()
+        try:
+            self.stream.start()
+        except Exception:
+            self._stop_grower()
+            raise
         self._is_recording = True
 
     def stop_recording(self) -> bytes:
@@ -69,33 +143,36 @@ class AudioRecorder:
         self.stream.close()
         self.stream = None
         self._is_recording = False
+        self._stop_grower()
 
         with self._lock:
-            if not self.buffer:
+            if not self._write_pos:
                 return b''
 
-            # Combine all chunks
-            audio_data = np.concatenate(list(self.buffer))
-
-        # Encode as WAV in memory
-        wav_buffer = io.BytesIO()
-        wavfile.write(wav_buffer, self.sample_rate, audio_data)
-        wav_buffer.seek(0)
-
-        return wav_buffer.getvalue()
+            # Patch the sizes into the header and join it with the filled
+            # segment slices: the PCM is copied once, straight into the
+            # result. The stream is closed, so only a new recording could
+            # touch the segments; holding the lock keeps them from being
+            # overwritten mid-encode.
+            full, rest = divmod(self._write_pos, self._segment_frames)
+            parts = [segment.data for segment in self._segments[:full]]
+            if rest:
+                parts.append(self._segments[full][:rest].data)
+            nbytes = self._write_pos * self.channels * 2
+            header = self._wav_header
+            struct.pack_into('<I', header, 4, 36 + nbytes)
+            struct.pack_into('<I', header, 40, nbytes)
+            return b''.join([header, *parts])
 
     def get_duration(self) -> float:
         """Return current recording duration in seconds."""
         with self._lock:
-            if not self.buffer:
-                return 0.0
-            total_samples = sum(chunk.shape[0] for chunk in self.buffer)
-            return total_samples / self.sample_rate
+            return self._write_pos / self.sample_rate
 
     def clear_buffer(self) -> None:
         """Discard any recorded audio."""
         with self._lock:
-            self.buffer.clear()
+            self._write_pos = 0
 
     @property
     def is_recording(self) -> bool:
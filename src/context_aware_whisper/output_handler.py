@@ -11,9 +11,27 @@ import pyperclip
 from context_aware_whisper.exceptions import OutputError
 
 
+def _build_keystroke_script(text: str) -> str:
+    """
+    Build the AppleScript that types text via System Events.
+
+    Args:
+        text: Text to type
+
+    Returns:
+        AppleScript source with text escaped for a double-quoted string
+    """
+    # Escape special characters for AppleScript
+    # Handle backslash first, then quotes
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"')
+    return f'tell application "System Events" to keystroke "{escaped}"'
+
+
 class OutputHandler:
     """Handles output of transcribed text to clipboard and active app."""
 
+    __slots__ = ("type_delay",)
+
     def __init__(self, type_delay: float = 0.0):
         """
         Initialize output handler.
@@ -56,12 +74,7 @@ class OutputHandler:
         if not text:
             return
 
-        # Escape special characters for AppleScript
-        # Handle backslash first, then quotes
-        escaped = text.replace('\\', '\\\\').replace('"', '\\"')
-
-        # Use AppleScript to type the text
-        script = f'tell application "System Events" to keystroke "{escaped}"'
+        script = _build_keystroke_script(text)
 
         try:
             result = subprocess.run(
@@ -6,6 +6,7 @@ Provides a minimal, always-on-top visual indicator showing the application state
 
 import random
 import sys
+import time
 import tkinter as tk
 from typing import Optional, List
 
@@ -23,6 +24,12 @@ else:
 # Valid position values
 VALID_POSITIONS = ["top-center", "top-right", "top-left", "bottom-center", "bottom-right", "bottom-left"]
 
+# Bar step sizes (2-5px) cycled through by the recording animation, so frames
+# need no RNG calls. Seeded, so the animation is the same on every run.
+_rng = random.Random(0)
+BAR_STEPS = tuple(_rng.randint(2, 5) for _ in range(256))
+del _rng
+
 
 def get_current_platform() -> str:
     """Detect the current platform."""
@@ -71,11 +78,19 @@ class RecordingIndicator:
     BAR_MIN_HEIGHT = 4
     BAR_MAX_HEIGHT = 16
     BAR_ANIMATION_INTERVAL_MS = 80  # ~12.5 FPS
+    BAR_TOTAL_WIDTH = BAR_COUNT * BAR_WIDTH + (BAR_COUNT - 1) * BAR_GAP  # All bars plus gaps
+    BAR_DIRECTIONS = (1, -1, 1, -1)  # Initial direction per bar, alternating up/down
 
     # Bar colors (red to orange gradient)
-    BAR_COLORS = ["#FF3B30", "#FF6B5B", "#FF9500", "#FF6B5B"]
+    BAR_COLORS = ("#FF3B30", "#FF6B5B", "#FF9500", "#FF6B5B")
+    _BAR_COLORS_SET = frozenset(BAR_COLORS)
     BAR_BG_COLOR = "#1C1C1E"
 
+    # Per-bar layout folded at class definition: each bar's x offset from the
+    # first bar, and its fill cycled from the palette (frames never recolor)
+    BAR_X_OFFSETS = tuple(range(0, BAR_COUNT * (BAR_WIDTH + BAR_GAP), BAR_WIDTH + BAR_GAP))
+    BAR_FILLS = (BAR_COLORS * BAR_COUNT)[:BAR_COUNT]
+
     def __init__(
         self,
         width: int = 60,
@@ -104,7 +119,22 @@ class RecordingIndicator:
         # Bar animation state
         self._bar_animation_id: Optional[str] = None
         self._bar_heights: List[int] = [self.BAR_MIN_HEIGHT] * self.BAR_COUNT
-        self._bar_directions: List[int] = [1, -1, 1, -1]  # Alternating up/down
+        self._bar_directions: List[int] = list(self.BAR_DIRECTIONS)  # Flipped at the limits
+        self._bg_item_id: Optional[int] = None  # Recording background item, while drawn
+        self._bar_item_ids: List[int] = []  # Canvas items for the bars, reused per frame
+        self._bar_drawn_heights: List[int] = []  # Heights the bar items currently show
+        self._bar_frame_deadline: Optional[float] = None  # time.monotonic() of next frame
+        self._bar_step_index = 0  # Position in BAR_STEPS
+        self._bar_frame_callback = self._animate_bars  # Bound once, rescheduled every frame
+
+        # What entering each state does to the window, after it is drawn
+        self._state_handlers = {
+            "idle": self.hide,
+            "recording": self.show,
+            "transcribing": self.show,
+            "success": self._show_and_flash,
+            "error": self._show_and_flash,
+        }
 
         # Create window if root not provided (for testing purposes)
         if root is None:
@@ -133,6 +163,10 @@ class RecordingIndicator:
         )
         self.canvas.pack()
 
+        # Bar positions are laid out once and only redone when the canvas is resized
+        self._layout_bars(width, height)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
         # Draw initial state
         self._draw_state()
 
@@ -361,10 +395,8 @@ class RecordingIndicator:
             self._draw_recording_bars()
             # Start animation if not already running
             if self._bar_animation_id is None:
-                self._bar_animation_id = self.window.after(
-                    self.BAR_ANIMATION_INTERVAL_MS,
-                    self._animate_bars
-                )
+                self._bar_frame_deadline = None
+                self._schedule_bar_frame()
             # Set opacity
             if self._transparency_supported:
                 try:
@@ -381,6 +413,8 @@ class RecordingIndicator:
 
         # Clear canvas
         self.canvas.delete("all")
+        self._bg_item_id = None
+        self._bar_item_ids = []
 
         # Draw rounded rectangle background
         self.canvas.create_rectangle(
@@ -407,81 +441,197 @@ class RecordingIndicator:
             except tk.TclError:
                 pass
 
+    def _layout_bars(self, canvas_width: int, canvas_height: int) -> None:
+        """Compute each bar's (x1, x2) span and the vertical center for a canvas size."""
+        start_x = (canvas_width - self.BAR_TOTAL_WIDTH) // 2
+        self._bar_x_pairs = tuple(
+            (start_x + offset, start_x + offset + self.BAR_WIDTH)
+            for offset in self.BAR_X_OFFSETS
+        )
+        self._bar_center_y = canvas_height // 2
+        self._bar_layout_size = (canvas_width, canvas_height)
+
+    def _on_canvas_configure(self, event) -> None:
+        """Re-center the bars when the canvas is resized."""
+        if (event.width, event.height) == self._bar_layout_size:
+            return  # Moved or re-mapped, not resized: the layout still holds
+        self._layout_bars(event.width, event.height)
+        # Drop the cached items so the next frame redraws at the new layout
+        self._bg_item_id = None
+        self._bar_item_ids = []
+
+    def _bar_coords(self, index: int, height: int) -> tuple:
+        """Canvas coordinates (x1, y1, x2, y2) of bar `index` at `height`."""
+        x1, x2 = self._bar_x_pairs[index]
+        center_y = self._bar_center_y
+        half = height // 2
+        return (x1, center_y - half, x2, center_y + half)
+
     def _draw_recording_bars(self) -> None:
-        """Draw animated audio visualizer bars for recording state."""
-        self.canvas.delete("all")
+        """
+        Draw animated audio visualizer bars for recording state.
+
+        The background and bar items are created once; while they are still
+        on the canvas, later draws only move the bars with canvas.coords.
+        Animation frames go through _update_recording_bars instead.
+        """
+        canvas = self.canvas
+        heights = self._bar_heights
+        bar_coords = self._bar_coords
+
+        if self._bg_item_id is not None and len(self._bar_item_ids) == len(heights):
+            for i, (item_id, height) in enumerate(zip(self._bar_item_ids, heights)):
+                canvas.coords(item_id, *bar_coords(i, height))
+            self._bar_drawn_heights = list(heights)
+            return
+
+        canvas.delete("all")
 
         # Draw dark background
-        self.canvas.create_rectangle(
+        self._bg_item_id = canvas.create_rectangle(
             0, 0, self.width, self.height,
             fill=self.BAR_BG_COLOR,
             outline=""
         )
 
-        # Calculate starting x position to center bars
-        total_bar_width = (self.BAR_COUNT * self.BAR_WIDTH) + ((self.BAR_COUNT - 1) * self.BAR_GAP)
-        start_x = (self.width - total_bar_width) // 2
-        center_y = self.height // 2
-
-        # Draw each bar
-        for i, height in enumerate(self._bar_heights):
-            x = start_x + i * (self.BAR_WIDTH + self.BAR_GAP)
-            y1 = center_y - height // 2
-            y2 = center_y + height // 2
-
-            self.canvas.create_rectangle(
-                x, y1, x + self.BAR_WIDTH, y2,
-                fill=self.BAR_COLORS[i % len(self.BAR_COLORS)],
+        # Draw each bar, keeping its item ID for later frames. Bars stay
+        # separate rectangles: a multi-point create_line is one connected
+        # polyline, and each bar keeps its own colour.
+        fills = self.BAR_FILLS
+        self._bar_item_ids = [
+            canvas.create_rectangle(
+                *bar_coords(i, height),
+                fill=fills[i],
                 outline=""
             )
+            for i, height in enumerate(heights)
+        ]
+        self._bar_drawn_heights = list(heights)
+
+    def _update_recording_bars(self) -> None:
+        """Resize the existing bar items whose height changed since they were drawn."""
+        if len(self._bar_item_ids) != len(self._bar_heights):
+            self._draw_recording_bars()
+            return
+
+        # Same geometry as _bar_coords, with the lookups bound once per frame.
+        # The moves are queued as one Tcl script and sent in a single
+        # round trip, rather than one canvas.coords call per bar.
+        drawn = self._bar_drawn_heights
+        x_pairs = self._bar_x_pairs
+        center_y = self._bar_center_y
+        path = self.canvas._w
+        commands = []
+        for i, (item_id, height) in enumerate(zip(self._bar_item_ids, self._bar_heights)):
+            if height != drawn[i]:
+                x1, x2 = x_pairs[i]
+                half = height // 2
+                commands.append(
+                    f"{path} coords {item_id} {x1} {center_y - half} {x2} {center_y + half}"
+                )
+                drawn[i] = height
+        if commands:
+            self.canvas.tk.eval("\n".join(commands))
 
     def _animate_bars(self) -> None:
         """Animate bar heights for recording visualization."""
         if self._current_state != "recording":
             return
 
-        # Update each bar height with randomness
-        for i in range(len(self._bar_heights)):
-            delta = random.randint(2, 5) * self._bar_directions[i]
-            self._bar_heights[i] += delta
+        # Nothing to paint while the window is withdrawn or unmapped: poll at
+        # half rate and restart the frame cadence once it is visible again
+        if not self.window.winfo_viewable():
+            self._bar_frame_deadline = None
+            self._bar_animation_id = self.window.after(
+                self.BAR_ANIMATION_INTERVAL_MS * 2, self._bar_frame_callback
+            )
+            return
+
+        # Update each bar height by the next steps from BAR_STEPS, working on
+        # locals and writing each bar back once
+        heights = self._bar_heights
+        directions = self._bar_directions
+        min_height = self.BAR_MIN_HEIGHT
+        max_height = self.BAR_MAX_HEIGHT
+        steps = BAR_STEPS
+        n_steps = len(steps)
+        step_index = self._bar_step_index
+        for i, direction in enumerate(directions):
+            height = heights[i] + steps[(step_index + i) % n_steps] * direction
 
             # Bounce at limits
-            if self._bar_heights[i] >= self.BAR_MAX_HEIGHT:
-                self._bar_heights[i] = self.BAR_MAX_HEIGHT
-                self._bar_directions[i] = -1
-            elif self._bar_heights[i] <= self.BAR_MIN_HEIGHT:
-                self._bar_heights[i] = self.BAR_MIN_HEIGHT
-                self._bar_directions[i] = 1
+            if height >= max_height:
+                height, direction = max_height, -1
+            elif height <= min_height:
+                height, direction = min_height, 1
+
+            heights[i] = height
+            directions[i] = direction
+        self._bar_step_index = (step_index + len(directions)) % n_steps
 
-        # Redraw bars
-        self._draw_recording_bars()
+        # Move the bars; Tk redraws them together once this callback returns
+        self._update_recording_bars()
 
         # Schedule next frame
-        self._bar_animation_id = self.window.after(
-            self.BAR_ANIMATION_INTERVAL_MS,
-            self._animate_bars
-        )
+        self._schedule_bar_frame()
+
+    def _schedule_bar_frame(self) -> None:
+        """
+        Schedule the next bar animation frame against a fixed cadence.
+
+        Frames are due every BAR_ANIMATION_INTERVAL_MS from the previous
+        deadline rather than from whenever the last frame finished, so time
+        spent drawing does not stretch the interval. A frame that is already
+        due runs via after_idle, letting Tk batch it with other pending work;
+        after falling behind, the cadence restarts from now instead of
+        bursting to catch up.
+        """
+        now = time.monotonic()
+        interval = self.BAR_ANIMATION_INTERVAL_MS / 1000
+        if self._bar_frame_deadline is None:
+            self._bar_frame_deadline = now + interval
+        else:
+            self._bar_frame_deadline += interval
+
+        delay_ms = round((self._bar_frame_deadline - now) * 1000)
+        if delay_ms <= 0:
+            self._bar_frame_deadline = now
+            self._bar_animation_id = self.window.after_idle(self._bar_frame_callback)
+        else:
+            self._bar_animation_id = self.window.after(delay_ms, self._bar_frame_callback)
+
+    def _cancel_after(self, after_id: str) -> None:
+        """
+        Cancel one pending after callback, ignoring ids Tk no longer knows.
+
+        Ids go through after_cancel one at a time rather than as one batched
+        "after cancel" script: Tcl would join several ids into a single
+        script that matches none of them, and after_cancel also deletes the
+        Tcl command wrapping the Python callback.
+        """
+        try:
+            self.window.after_cancel(after_id)
+        except (tk.TclError, ValueError):
+            pass
 
     def _stop_bar_animation(self) -> None:
         """Stop the bar animation and reset state."""
-        if self._bar_animation_id is not None:
-            try:
-                self.window.after_cancel(self._bar_animation_id)
-            except tk.TclError:
-                pass
-            self._bar_animation_id = None
+        # Clear the id before cancelling so a re-entrant stop (e.g. from
+        # destroy) never cancels the same callback twice
+        after_id, self._bar_animation_id = self._bar_animation_id, None
+        if after_id is not None:
+            self._cancel_after(after_id)
+        self._bar_frame_deadline = None
 
-        # Reset bar heights
-        self._bar_heights = [self.BAR_MIN_HEIGHT] * self.BAR_COUNT
+        # Reset bar heights in place, unless an earlier stop already did
+        if any(h != self.BAR_MIN_HEIGHT for h in self._bar_heights):
+            self._bar_heights[:] = [self.BAR_MIN_HEIGHT] * self.BAR_COUNT
 
     def _cancel_animations(self) -> None:
         """Cancel all pending animation callbacks."""
         # Cancel flash animations
         for after_id in self._flash_after_ids:
-            try:
-                self.window.after_cancel(after_id)
-            except (tk.TclError, ValueError):
-                pass
+            self._cancel_after(after_id)
         self._flash_after_ids.clear()
 
         # Cancel bar animation
@@ -530,7 +680,8 @@ class RecordingIndicator:
         Args:
             state: One of "idle", "recording", "transcribing", "success", "error"
         """
-        if state not in self.STATE_CONFIG:
+        enter_state = self._state_handlers.get(state)
+        if enter_state is None:
             raise ValueError(f"Invalid state: {state}. Must be one of {list(self.STATE_CONFIG.keys())}")
 
         # Cancel any pending animations
@@ -539,15 +690,13 @@ class RecordingIndicator:
         self._current_state = state
         self._draw_state()
 
-        # Show window if not idle, hide if idle
-        if state == "idle":
-            self.hide()
-        else:
-            self.show()
+        # Hide when idle, show otherwise (flashing for success/error)
+        enter_state()
 
-        # Flash animation for success/error states
-        if state in ("success", "error"):
-            self._schedule_flash_animation()
+    def _show_and_flash(self) -> None:
+        """Show the window and start the success/error flash animation."""
+        self.show()
+        self._schedule_flash_animation()
 
     def show(self) -> None:
         """Show the indicator window without stealing focus."""
@@ -9,17 +9,18 @@ which ensures it can NEVER steal focus from other applications.
 Usage:
     python subprocess_indicator.py
 
-Communication via stdin:
-    recording\n      - Show recording state (red pulsing dots)
-    transcribing\n   - Show transcribing state (orange animated dots)
-    success\n        - Flash success (green checkmark), then hide
-    error\n          - Flash error (red X), then hide
-    idle\n           - Hide indicator
-    exit\n           - Terminate subprocess
+Communication via stdin (one byte per command):
+    R   - Show recording state (red pulsing dots)
+    T   - Show transcribing state (orange animated dots)
+    S   - Flash success (green checkmark), then hide
+    E   - Flash error (red X), then hide
+    I   - Hide indicator
+    X   - Terminate subprocess
 
 Outputs "ready\n" to stdout when initialized and ready for commands.
 """
 
+import os
 import sys
 import select
 import threading
@@ -78,6 +79,83 @@ COLOR_ORANGE = (1.0, 0.584, 0.0)     # #FF9500
 COLOR_GREEN = (0.204, 0.78, 0.349)   # #34C759
 COLOR_WHITE = (1.0, 1.0, 1.0)
 
+# Dot layout for the animated states
+DOT_SPACING = 16
+DOT_BASE_SIZE = 6
+ANIMATION_STEPS = 6  # Animation phase advances in 0.5 steps over [0, 3)
+
+# Single-byte stdin commands (must match STATE_CODES/EXIT_CODE in the client)
+COMMAND_CODES = {
+    ord("R"): "recording",
+    ord("T"): "transcribing",
+    ord("S"): "success",
+    ord("E"): "error",
+    ord("I"): "idle",
+    ord("X"): "exit",
+}
+
+# Timing
+ANIMATION_INTERVAL = 0.15   # Seconds between animation steps
+ANIMATION_TOLERANCE = 0.02  # Leeway for animation ticks
+HIDE_DELAY = 0.8            # Seconds to show success/error before hiding
+HIDE_TOLERANCE = 0.1        # Leeway for the hide timer so macOS can coalesce wake-ups
+
+
+def _build_recording_lut(cx, cy):
+    """Precompute the pulsing dot rects for every recording animation step."""
+    positions = (cx - DOT_SPACING, cx, cx + DOT_SPACING)
+    lut = []
+    for step in range(ANIMATION_STEPS):
+        phase = step / 2
+        ovals = []
+        for i, x in enumerate(positions):
+            size = DOT_BASE_SIZE + 2 * (1 - abs((phase - i) % 3 - 1.5) / 1.5)
+            ovals.append(NSMakeRect(x - size / 2, cy - size / 2, size, size))
+        lut.append(tuple(ovals))
+    return tuple(lut)
+
+
+def _build_transcribing_lut(cx, cy):
+    """Precompute the wave dot rects for every transcribing animation step."""
+    positions = (cx - DOT_SPACING, cx, cx + DOT_SPACING)
+    half = DOT_BASE_SIZE / 2
+    lut = []
+    for step in range(ANIMATION_STEPS):
+        phase = step / 2
+        ovals = []
+        for i, x in enumerate(positions):
+            y = cy + 4 * ((phase + i) % 3 - 1)
+            ovals.append(NSMakeRect(x - half, y - half, DOT_BASE_SIZE, DOT_BASE_SIZE))
+        lut.append(tuple(ovals))
+    return tuple(lut)
+
+
+def _build_checkmark_path(cx, cy):
+    """Build the stroke path for the success checkmark."""
+    path = NSBezierPath.bezierPath()
+    path.setLineWidth_(3.0)
+    path.setLineCapStyle_(1)  # Round cap
+    path.setLineJoinStyle_(1)  # Round join
+
+    path.moveToPoint_((cx - 8, cy))
+    path.lineToPoint_((cx - 2, cy + 6))
+    path.lineToPoint_((cx + 10, cy - 6))
+    return path
+
+
+def _build_error_x_path(cx, cy):
+    """Build the stroke path for the error X."""
+    path = NSBezierPath.bezierPath()
+    path.setLineWidth_(3.0)
+    path.setLineCapStyle_(1)  # Round cap
+
+    size = 8
+    path.moveToPoint_((cx - size, cy - size))
+    path.lineToPoint_((cx + size, cy + size))
+    path.moveToPoint_((cx + size, cy - size))
+    path.lineToPoint_((cx - size, cy + size))
+    return path
+
 
 class IndicatorContentView(NSView):
     """
@@ -97,6 +175,52 @@ class IndicatorContentView(NSView):
             return None
         self._state = "idle"
         self._animation_phase = 0  # For pulsing/animation
+
+        # The view never resizes, so dot geometry for every animation
+        # step can be computed once up front
+        cx = frame.size.width / 2
+        cy = frame.size.height / 2
+        self._recording_lut = _build_recording_lut(cx, cy)
+        self._transcribing_lut = _build_transcribing_lut(cx, cy)
+
+        # Area covered by the animated dots; animation ticks only invalidate this
+        max_dot = DOT_BASE_SIZE + 2
+        self._dots_rect = NSMakeRect(
+            cx - DOT_SPACING - max_dot / 2 - 1,
+            cy - 4 - max_dot / 2 - 1,
+            2 * DOT_SPACING + max_dot + 2,
+            8 + max_dot + 2,
+        )
+
+        self._checkmark_path = _build_checkmark_path(cx, cy)
+        self._error_x_path = _build_error_x_path(cx, cy)
+
+        # Reused every frame so all three dots are filled in one call
+        self._scratch_path = NSBezierPath.bezierPath()
+
+        self._red = NSColor.colorWithRed_green_blue_alpha_(*COLOR_RED, 1.0)
+        self._orange = NSColor.colorWithRed_green_blue_alpha_(*COLOR_ORANGE, 1.0)
+        self._green = NSColor.colorWithRed_green_blue_alpha_(*COLOR_GREEN, 1.0)
+
+        # Per-state draw method, selected once in setState_
+        self._draw_dispatch = {
+            "recording": self._draw_recording_dots,
+            "transcribing": self._draw_transcribing_dots,
+            "success": self._draw_checkmark,
+            "error": self._draw_error_x,
+            "idle": None,
+        }
+        self._active_draw = None
+
+        # Let Core Animation composite the rounded background once instead
+        # of rasterizing the path in drawRect_ on every repaint
+        self.setWantsLayer_(True)
+        layer = self.layer()
+        layer.setCornerRadius_(CORNER_RADIUS)
+        layer.setBackgroundColor_(
+            NSColor.colorWithRed_green_blue_alpha_(*BACKGROUND_COLOR).CGColor()
+        )
+        layer.setMasksToBounds_(True)
         return self
 
     def isFlipped(self):
@@ -105,106 +229,51 @@ class IndicatorContentView(NSView):
 
     def drawRect_(self, rect):
         """Draw the indicator content."""
-        bounds = self.bounds()
+        # Background is drawn by the view's layer
+        draw = self._active_draw
+        if draw is not None:
+            draw()
 
-        # Draw rounded rectangle background
-        bg_path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(
-            bounds, CORNER_RADIUS, CORNER_RADIUS
-        )
-        bg_color = NSColor.colorWithRed_green_blue_alpha_(*BACKGROUND_COLOR)
-        bg_color.setFill()
-        bg_path.fill()
-
-        if self._state == "idle":
-            return
-
-        # Center of the view
-        cx = bounds.size.width / 2
-        cy = bounds.size.height / 2
-
-        if self._state == "recording":
-            self._draw_recording_dots(cx, cy)
-        elif self._state == "transcribing":
-            self._draw_transcribing_dots(cx, cy)
-        elif self._state == "success":
-            self._draw_checkmark(cx, cy)
-        elif self._state == "error":
-            self._draw_error_x(cx, cy)
-
-    def _draw_recording_dots(self, cx, cy):
+    def _draw_recording_dots(self):
         """Draw 3 red pulsing dots."""
-        color = NSColor.colorWithRed_green_blue_alpha_(*COLOR_RED, 1.0)
-
-        # Pulse sizes based on animation phase
-        base_size = 6
-        pulse_sizes = [
-            base_size + 2 * (1 - abs((self._animation_phase - 0) % 3 - 1.5) / 1.5),
-            base_size + 2 * (1 - abs((self._animation_phase - 1) % 3 - 1.5) / 1.5),
-            base_size + 2 * (1 - abs((self._animation_phase - 2) % 3 - 1.5) / 1.5),
-        ]
-
-        spacing = 16
-        positions = [cx - spacing, cx, cx + spacing]
-
-        for i, (x, size) in enumerate(zip(positions, pulse_sizes)):
-            color.setFill()
-            oval = NSMakeRect(x - size/2, cy - size/2, size, size)
-            path = NSBezierPath.bezierPathWithOvalInRect_(oval)
-            path.fill()
-
-    def _draw_transcribing_dots(self, cx, cy):
+        self._red.setFill()
+
+        # Always exactly three dots, so the appends are unrolled
+        oval0, oval1, oval2 = self._recording_lut[int(self._animation_phase * 2)]
+        path = self._scratch_path
+        path.removeAllPoints()
+        path.appendBezierPathWithOvalInRect_(oval0)
+        path.appendBezierPathWithOvalInRect_(oval1)
+        path.appendBezierPathWithOvalInRect_(oval2)
+        path.fill()
+
+    def _draw_transcribing_dots(self):
         """Draw 3 orange dots with wave animation."""
-        color = NSColor.colorWithRed_green_blue_alpha_(*COLOR_ORANGE, 1.0)
-
-        spacing = 16
-        positions = [cx - spacing, cx, cx + spacing]
-        base_size = 6
-
-        for i, x in enumerate(positions):
-            # Wave animation offset
-            offset = 4 * ((self._animation_phase + i) % 3 - 1)
-            y = cy + offset
-
-            color.setFill()
-            oval = NSMakeRect(x - base_size/2, y - base_size/2, base_size, base_size)
-            path = NSBezierPath.bezierPathWithOvalInRect_(oval)
-            path.fill()
-
-    def _draw_checkmark(self, cx, cy):
+        self._orange.setFill()
+
+        # Always exactly three dots, so the appends are unrolled
+        oval0, oval1, oval2 = self._transcribing_lut[int(self._animation_phase * 2)]
+        path = self._scratch_path
+        path.removeAllPoints()
+        path.appendBezierPathWithOvalInRect_(oval0)
+        path.appendBezierPathWithOvalInRect_(oval1)
+        path.appendBezierPathWithOvalInRect_(oval2)
+        path.fill()
+
+    def _draw_checkmark(self):
         """Draw a green checkmark."""
-        color = NSColor.colorWithRed_green_blue_alpha_(*COLOR_GREEN, 1.0)
-        color.setStroke()
+        self._green.setStroke()
+        self._checkmark_path.stroke()
 
-        path = NSBezierPath.bezierPath()
-        path.setLineWidth_(3.0)
-        path.setLineCapStyle_(1)  # Round cap
-        path.setLineJoinStyle_(1)  # Round join
-
-        # Checkmark path
-        path.moveToPoint_((cx - 8, cy))
-        path.lineToPoint_((cx - 2, cy + 6))
-        path.lineToPoint_((cx + 10, cy - 6))
-        path.stroke()
-
-    def _draw_error_x(self, cx, cy):
+    def _draw_error_x(self):
         """Draw a red X."""
-        color = NSColor.colorWithRed_green_blue_alpha_(*COLOR_RED, 1.0)
-        color.setStroke()
-
-        path = NSBezierPath.bezierPath()
-        path.setLineWidth_(3.0)
-        path.setLineCapStyle_(1)  # Round cap
-
-        size = 8
-        path.moveToPoint_((cx - size, cy - size))
-        path.lineToPoint_((cx + size, cy + size))
-        path.moveToPoint_((cx + size, cy - size))
-        path.lineToPoint_((cx - size, cy + size))
-        path.stroke()
+        self._red.setStroke()
+        self._error_x_path.stroke()
 
     def setState_(self, state):
         """Set the indicator state."""
         self._state = state
+        self._active_draw = self._draw_dispatch.get(state)
         self._animation_phase = 0
         self.setNeedsDisplay_(True)
 
@@ -213,6 +282,11 @@ class IndicatorContentView(NSView):
         self._animation_phase = phase
         self.setNeedsDisplay_(True)
 
+    def advanceAnimation_(self, timer):
+        """Advance the animation one step (NSTimer target)."""
+        self._animation_phase = (self._animation_phase + 0.5) % 3
+        self.setNeedsDisplayInRect_(self._dots_rect)
+
     def getState(self):
         """Get current state."""
         return self._state
@@ -229,8 +303,8 @@ class SubprocessIndicator:
     def __init__(self):
         self._panel: Optional[NSPanel] = None
         self._view: Optional[IndicatorContentView] = None
-        self._animation_timer: Optional[NSTimer] = None
-        self._hide_timer: Optional[NSTimer] = None
+        # Animation and auto-hide never overlap, so one timer slot serves both
+        self._timer: Optional[NSTimer] = None
         self._current_state = "idle"
 
         self._create_panel()
@@ -298,7 +372,7 @@ class SubprocessIndicator:
             self._view.setState_(state)
             self._show()
             # Auto-hide after 800ms
-            self._schedule_hide(0.8)
+            self._schedule_hide(HIDE_DELAY)
 
     def _show(self):
         """Show the panel without stealing focus."""
@@ -310,37 +384,44 @@ class SubprocessIndicator:
 
     def _start_animation(self):
         """Start animation timer for recording/transcribing states."""
-        def animate_tick():
-            if self._current_state in ("recording", "transcribing"):
-                phase = (self._view._animation_phase + 0.5) % 3
-                self._view.setAnimationPhase_(phase)
-
-        # Create a repeating timer
-        self._animation_timer = NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-            0.15,  # 150ms interval
+        # Target the view's selector directly so each tick is dispatched by
+        # Objective-C without going through a Python closure
+        self._timer = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            ANIMATION_INTERVAL,
+            self._view,
+            "advanceAnimation:",
+            None,
             True,
-            lambda timer: animate_tick()
         )
+        self._timer.setTolerance_(ANIMATION_TOLERANCE)
 
     def _schedule_hide(self, delay: float):
-        """Schedule hiding after a delay."""
+        """
+        Schedule hiding after a delay.
+
+        The hide deadline is not perceptible to the millisecond, so the timer
+        gets a tolerance that lets the OS batch this wake-up with others.
+        """
         def hide_callback():
             self.set_state("idle")
 
-        self._hide_timer = NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
+        self._timer = NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
             delay,
             False,
             lambda timer: hide_callback()
         )
+        self._timer.setTolerance_(HIDE_TOLERANCE)
 
     def _cancel_timers(self):
-        """Cancel all pending timers."""
-        if self._animation_timer:
-            self._animation_timer.invalidate()
-            self._animation_timer = None
-        if self._hide_timer:
-            self._hide_timer.invalidate()
-            self._hide_timer = None
+        """Cancel the pending animation or auto-hide timer."""
+        if self._timer:
+            self._timer.invalidate()
+            self._timer = None
+
+    @property
+    def has_pending_work(self) -> bool:
+        """Whether an animation or auto-hide timer needs the run loop."""
+        return self._timer is not None
 
     def cleanup(self):
         """Clean up resources."""
@@ -354,40 +435,49 @@ def run_event_loop(indicator: SubprocessIndicator):
     """
     Run the main event loop, reading commands from stdin.
 
-    Uses select() to check for stdin input without blocking,
-    while also processing the NSRunLoop for UI updates.
+    While a timer is pending, alternates between short NSRunLoop slices and
+    a non-blocking select() on stdin. When the indicator is idle there is
+    nothing for the run loop to do, so it blocks on stdin instead of
+    waking up every 50ms.
     """
     # Signal that we're ready
     print("ready", flush=True)
 
     run_loop = NSRunLoop.currentRunLoop()
+    stdin_fd = sys.stdin.fileno()
     running = True
 
     while running:
-        # Process pending UI events (animations, timers)
-        # Run for a short interval to allow stdin checking
-        run_loop.runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(0.05))
-
-        # Check for stdin input (non-blocking)
-        readable, _, _ = select.select([sys.stdin], [], [], 0)
+        if indicator.has_pending_work:
+            # Process pending UI events (animations, timers)
+            # Run for a short interval to allow stdin checking
+            run_loop.runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(0.05))
+            timeout = 0
+        else:
+            # Flush pending UI updates, then sleep until the next command
+            run_loop.runUntilDate_(NSDate.date())
+            timeout = None
+
+        readable, _, _ = select.select([stdin_fd], [], [], timeout)
 
         if readable:
             try:
-                line = sys.stdin.readline()
-                if not line:
+                data = os.read(stdin_fd, 64)
+                if not data:
                     # EOF - parent process closed stdin
                     running = False
                     continue
 
-                command = line.strip().lower()
-
-                if command == "exit":
-                    running = False
-                elif command in ("recording", "transcribing", "success", "error", "idle"):
-                    indicator.set_state(command)
-                elif command:
-                    # Unknown command - ignore but log
-                    print(f"Unknown command: {command}", file=sys.stderr)
+                for code in data:
+                    command = COMMAND_CODES.get(code)
+                    if command == "exit":
+                        running = False
+                        break
+                    elif command:
+                        indicator.set_state(command)
+                    elif not chr(code).isspace():
+                        # Unknown command - ignore but log
+                        print(f"Unknown command: {chr(code)!r}", file=sys.stderr)
             except Exception as e:
                 print(f"Error reading command: {e}", file=sys.stderr)
 
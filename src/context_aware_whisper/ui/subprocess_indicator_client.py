@@ -5,6 +5,9 @@ Client wrapper for the subprocess-based recording indicator.
 Manages subprocess lifecycle and provides a simple interface for state updates.
 """
 
+import fcntl
+import os
+import select
 import subprocess
 import sys
 import threading
@@ -13,6 +16,18 @@ from pathlib import Path
 from typing import Optional
 
 
+# Single-byte commands understood by subprocess_indicator.py. Payloads are
+# prebuilt so set_state only does a dict lookup and a write.
+STATE_CODES = {
+    "recording": b"R",
+    "transcribing": b"T",
+    "success": b"S",
+    "error": b"E",
+    "idle": b"I",
+}
+EXIT_CODE = b"X"
+
+
 class SubprocessIndicator:
     """
     Client for the subprocess-based recording indicator.
@@ -36,13 +51,25 @@ class SubprocessIndicator:
     # Timeout for subprocess termination
     STOP_TIMEOUT = 2.0
 
+    # Delay before retrying a failed restart, doubled after each failure
+    RESTART_BACKOFF_INITIAL = 0.5
+    RESTART_BACKOFF_MAX = 30.0
+
     def __init__(self):
         """Initialize the subprocess indicator client."""
         self._process: Optional[subprocess.Popen] = None
         self._started = False
+        self._alive = False  # Cleared by the watchdog when the subprocess exits
         self._lock = threading.Lock()
         self._current_state = "idle"
 
+        # Restart circuit breaker
+        self._restart_lock = threading.Lock()
+        self._restart_needed = False
+        self._restart_scheduled = False  # Guarded by _lock
+        self._restart_backoff = self.RESTART_BACKOFF_INITIAL
+        self._next_restart_allowed = 0.0
+
     def start(self) -> bool:
         """
         Launch the indicator subprocess.
@@ -72,31 +99,55 @@ class SubprocessIndicator:
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,  # Line buffered
+                    bufsize=0,  # Unbuffered binary pipes
                 )
 
-                # Wait for "ready" signal
-                start_time = time.time()
-                while time.time() - start_time < self.READY_TIMEOUT:
-                    if self._process.poll() is not None:
-                        # Process exited prematurely
-                        stderr_output = self._process.stderr.read() if self._process.stderr else ""
-                        print(f"[Warning] Subprocess exited prematurely: {stderr_output}", file=sys.stderr)
-                        self._process = None
-                        return False
-
-                    # Check if stdout has data
+                # Wait for "ready" signal. The pipe is switched to non-blocking
+                # mode so select() can enforce a real timeout instead of
+                # readline() blocking until a newline arrives.
+                fd = self._process.stdout.fileno()
+                flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+                fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+
+                buffer = b""
+                deadline = time.monotonic() + self.READY_TIMEOUT
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+
+                    readable, _, _ = select.select([fd], [], [], remaining)
+                    if not readable:
+                        continue
+
                     try:
-                        # Non-blocking read attempt
-                        line = self._process.stdout.readline()
-                        if line.strip() == "ready":
+                        chunk = os.read(fd, 1024)
+                    except BlockingIOError:
+                        continue
+
+                    if chunk:
+                        buffer += chunk
+                        if b"ready\n" in buffer:
                             self._started = True
+                            self._alive = True
+                            threading.Thread(
+                                target=self._watchdog, args=(self._process,), daemon=True
+                            ).start()
                             return True
-                    except Exception:
-                        pass
+                        continue
+
+                    # EOF on stdout - the subprocess is exiting without
+                    # having signalled ready
+                    try:
+                        self._process.wait(timeout=self.STOP_TIMEOUT)
+                    except subprocess.TimeoutExpired:
+                        break
 
-                    time.sleep(0.01)
+                    # Process exited prematurely
+                    stderr_output = self._process.stderr.read().decode(errors="replace") if self._process.stderr else ""
+                    print(f"[Warning] Subprocess exited prematurely: {stderr_output}", file=sys.stderr)
+                    self._process = None
+                    return False
 
                 # Timeout waiting for ready
                 print("[Warning] Timeout waiting for subprocess indicator to be ready", file=sys.stderr)
@@ -116,32 +167,46 @@ class SubprocessIndicator:
             state: One of "idle", "recording", "transcribing", "success", "error"
         """
         if not self._started or not self._process:
+            if self._restart_needed:
+                self._schedule_restart()
             return
 
-        valid_states = ("idle", "recording", "transcribing", "success", "error")
-        if state not in valid_states:
+        payload = STATE_CODES.get(state)
+        if payload is None:
             return
 
         # Don't send redundant state updates (except for success/error which auto-hide)
         if state == self._current_state and state not in ("success", "error"):
             return
 
+        # Liveness is tracked by the watchdog thread, so there is no
+        # waitpid() syscall here; a dead pipe surfaces as BrokenPipeError
         with self._lock:
-            if not self._process or self._process.poll() is not None:
+            process = self._process
+            if not process:
                 # Process died
                 self._started = False
-                self._try_restart()
-                return
+                self._restart_needed = True
 
-            try:
-                self._process.stdin.write(f"{state}\n")
-                self._process.stdin.flush()
-                self._current_state = state
-            except (BrokenPipeError, OSError) as e:
-                # Process died or pipe broken
-                print(f"[Warning] Failed to send state to subprocess: {e}", file=sys.stderr)
+        if not process:
+            self._schedule_restart()
+            return
+
+        # Write outside the lock so a stalled subprocess cannot block other
+        # callers; single-byte pipe writes are atomic
+        try:
+            process.stdin.write(payload)
+            process.stdin.flush()
+            self._current_state = state
+        except (BrokenPipeError, OSError, ValueError) as e:
+            # Process died, pipe broken, or stop() closed it underneath us
+            with self._lock:
+                if self._process is not process:
+                    return
                 self._started = False
-                self._try_restart()
+                self._restart_needed = True
+            print(f"[Warning] Failed to send state to subprocess: {e}", file=sys.stderr)
+            self._schedule_restart()
 
     def stop(self) -> None:
         """
@@ -151,15 +216,21 @@ class SubprocessIndicator:
             return
 
         with self._lock:
+            # The watchdog holds the Popen wait lock while it blocks, so
+            # poll() would always report the process as running; its own
+            # liveness flag is the reliable signal
+            alive = self._alive
             self._started = False
+            self._alive = False
+            self._restart_needed = False
             self._current_state = "idle"
 
             if self._process:
                 try:
                     # Send exit command
-                    if self._process.poll() is None:
+                    if alive:
                         try:
-                            self._process.stdin.write("exit\n")
+                            self._process.stdin.write(EXIT_CODE)
                             self._process.stdin.flush()
                         except (BrokenPipeError, OSError):
                             pass
@@ -175,6 +246,7 @@ class SubprocessIndicator:
 
     def _kill_process(self) -> None:
         """Force kill the subprocess."""
+        self._alive = False
         if self._process:
             try:
                 self._process.kill()
@@ -183,27 +255,93 @@ class SubprocessIndicator:
                 pass
             self._process = None
 
+    def _watchdog(self, process: subprocess.Popen) -> None:
+        """
+        Block until the subprocess exits and schedule a restart if it died
+        while still in use.
+        """
+        try:
+            process.wait()
+        except Exception:
+            return
+
+        with self._lock:
+            if self._process is not process:
+                # Stopped or replaced deliberately
+                return
+            self._alive = False
+            self._started = False
+            self._restart_needed = True
+
+        self._schedule_restart()
+
+    def _schedule_restart(self) -> None:
+        """
+        Restart the subprocess on a background thread.
+
+        Spawning the interpreter and importing PyObjC takes hundreds of
+        milliseconds, so callers such as the recording thread must not wait
+        for it. Does nothing while the restart backoff window is open or
+        a restart thread is already pending, so a burst of failures starts
+        at most one thread.
+        """
+        if time.monotonic() < self._next_restart_allowed:
+            return
+        with self._lock:
+            if self._restart_scheduled:
+                return
+            self._restart_scheduled = True
+        threading.Thread(target=self._try_restart, daemon=True).start()
+
     def _try_restart(self) -> None:
         """
         Attempt to restart the subprocess if it died unexpectedly.
+
+        Failed attempts open a backoff window that doubles on every failure
+        (capped at RESTART_BACKOFF_MAX), so a subprocess that keeps dying
+        degrades to a no-op indicator instead of being respawned constantly.
         """
-        self._kill_process()
+        if not self._restart_lock.acquire(blocking=False):
+            # Another restart is already in progress
+            with self._lock:
+                self._restart_scheduled = False
+            return
 
-        # Try to restart once
         try:
-            if self.start():
-                # Restore previous state if not idle
-                if self._current_state != "idle":
-                    state_to_restore = self._current_state
-                    self._current_state = "idle"  # Reset to allow set_state
-                    self.set_state(state_to_restore)
-        except Exception:
-            pass
+            if time.monotonic() < self._next_restart_allowed:
+                return
+
+            with self._lock:
+                self._kill_process()
+
+            try:
+                restarted = self.start()
+            except Exception:
+                restarted = False
+
+            if not restarted:
+                self._next_restart_allowed = time.monotonic() + self._restart_backoff
+                self._restart_backoff = min(self.RESTART_BACKOFF_MAX, self._restart_backoff * 2)
+                return
+
+            self._restart_needed = False
+            self._restart_backoff = self.RESTART_BACKOFF_INITIAL
+            self._next_restart_allowed = 0.0
+        finally:
+            self._restart_lock.release()
+            with self._lock:
+                self._restart_scheduled = False
+
+        # Restore previous state if not idle
+        if self._current_state != "idle":
+            state_to_restore = self._current_state
+            self._current_state = "idle"  # Reset to allow set_state
+            self.set_state(state_to_restore)
 
     @property
     def is_running(self) -> bool:
         """Whether the subprocess is currently running."""
-        return self._started and self._process is not None and self._process.poll() is None
+        return self._alive
 
     @property
     def current_state(self) -> str:
@@ -0,0 +1,81 @@
+"""Plain helpers shared by the unit tests."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from context_aware_whisper.ui import indicator as indicator_module
+
+
+# tk.Toplevel / tk.Canvas members RecordingIndicator and its tests touch. The
+# tkinter stubs in conftest have no real methods, so indicator tests spec their
+# window and canvas mocks against these lists instead of the tkinter classes.
+TOPLEVEL_SPEC = [
+    "_w", "tk", "after", "after_cancel", "after_idle", "attributes", "deiconify",
+    "destroy", "geometry", "lift", "overrideredirect", "update", "update_idletasks",
+    "winfo_height", "winfo_screenheight", "winfo_screenwidth", "winfo_viewable",
+    "winfo_vrootx", "winfo_vrooty", "winfo_width", "winfo_x", "winfo_y", "withdraw",
+]
+CANVAS_SPEC = [
+    "_w", "tk", "bind", "coords", "create_rectangle", "create_text", "delete",
+    "itemconfig", "itemconfigure", "pack", "update_idletasks",
+]
+
+
+def configure_mock_window(mock_window):
+    """Give a mock window the screen geometry and visibility the indicator queries."""
+    mock_window.winfo_screenwidth.return_value = 1920
+    mock_window.winfo_screenheight.return_value = 1080
+    mock_window.winfo_viewable.return_value = True
+    mock_window.winfo_vrootx.return_value = 0
+    mock_window.winfo_vrooty.return_value = 0
+
+
+def reset_indicator(parts):
+    """Reset a shared indicator and its mocks to their just-built state."""
+    indicator, mock_window, mock_canvas = parts
+    mock_window.reset_mock(return_value=True, side_effect=True)
+    mock_canvas.reset_mock(return_value=True, side_effect=True)
+    configure_mock_window(mock_window)
+
+    indicator._current_state = "idle"
+    indicator._flash_after_ids = []
+    indicator._bar_animation_id = None
+    indicator._bar_heights = [indicator.BAR_MIN_HEIGHT] * indicator.BAR_COUNT
+    indicator._bar_directions = list(indicator.BAR_DIRECTIONS)
+    indicator._bg_item_id = None
+    indicator._bar_item_ids = []
+    indicator._bar_drawn_heights = []
+    indicator._bar_frame_deadline = None
+    indicator._bar_step_index = 0
+    indicator._layout_bars(indicator.width, indicator.height)
+    return parts
+
+
+def create_mock_tkinter():
+    """
+    Create comprehensive tkinter mocks for indicator testing.
+
+    The mocks are specced with the Toplevel/Canvas methods the indicator
+    uses, so a typo fails loudly instead of growing a fresh child mock.
+    """
+    mock_window = MagicMock(spec=TOPLEVEL_SPEC)
+    configure_mock_window(mock_window)
+    mock_canvas = MagicMock(spec=CANVAS_SPEC)
+    mock_canvas._w = ".!canvas"
+    return mock_window, mock_canvas
+
+
+def create_indicator_with_mocks(position="top-center", width=60, height=24):
+    """
+    Create a RecordingIndicator with mocked tkinter.
+
+    tkinter itself is already stubbed by tests/conftest.py, so no Tcl
+    interpreter starts; the mocks only stand in for the window and canvas
+    so tests can inspect the calls made on them.
+    """
+    mock_window, mock_canvas = create_mock_tkinter()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(indicator_module.tk, "Toplevel", lambda *args, **kwargs: mock_window)
+        mp.setattr(indicator_module.tk, "Canvas", lambda *args, **kwargs: mock_canvas)
+        indicator = indicator_module.RecordingIndicator(width=width, height=height, position=position)
+    return indicator, mock_window, mock_canvas
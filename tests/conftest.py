@@ -8,13 +8,62 @@ PERFORMANCE: Common fixtures are cached at session/module level to avoid
 repeated setup overhead in tests.
 """
 
-import io
+import struct
 import sys
+import types
 from functools import lru_cache
 from unittest.mock import MagicMock, Mock, patch
 
-import numpy as np
-from scipy.io import wavfile
+
+class _TkStub:
+    """
+    Inert stand-in for tkinter widgets.
+
+    Every attribute access and call returns another stub. Unlike MagicMock
+    nothing is recorded; tests that inspect widgets patch in their own mocks.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __call__(self, *args, **kwargs):
+        return _TkStub()
+
+    def __getattr__(self, name):
+        return _stub_getattr(name)
+
+
+def _stub_getattr(name):
+    """Return a stub for any name except dunders, which stay missing."""
+    if name.startswith('__'):
+        raise AttributeError(name)
+    return _TkStub()
+
+
+def _stub_module(name):
+    """Build an empty module whose public attributes are all stubs."""
+    module = types.ModuleType(name)
+    module.__getattr__ = _stub_getattr
+    return module
+
+
+def _build_tkinter_stubs():
+    """Build plain module stubs for _tkinter, tkinter and tkinter.ttk."""
+    ttk = _stub_module('tkinter.ttk')
+
+    tk = _stub_module('tkinter')
+    tk.ttk = ttk
+    for widget in ('Tk', 'Toplevel', 'Canvas', 'Frame', 'Label', 'Button'):
+        setattr(tk, widget, _TkStub)
+    tk.TclError = Exception
+    # Version attributes must be real numbers for comparison operations
+    tk.TkVersion = 8.6
+    tk.TclVersion = 8.6
+    # String constants
+    for constant in ('X', 'Y', 'BOTH', 'LEFT', 'RIGHT', 'TOP', 'BOTTOM', 'VERTICAL',
+                     'FLAT', 'END', 'NORMAL', 'DISABLED', 'WORD', 'NONE'):
+        setattr(tk, constant, constant.lower())
+    return _stub_module('_tkinter'), tk, ttk
 
 
 def _setup_global_mocks():
@@ -30,37 +79,12 @@ def _setup_global_mocks():
 
     # Disable menu bar to prevent SIGABRT crashes from NSStatusBar in pytest
     os.environ["CAW_DISABLE_MENUBAR"] = "1"
-    # Mock tkinter if not available (headless environments)
+    # Stub tkinter if not available (headless environments)
     if '_tkinter' not in sys.modules:
-        mock_tk = MagicMock()
-        mock_tk.Tk = MagicMock(return_value=MagicMock())
-        mock_tk.Toplevel = MagicMock(return_value=MagicMock())
-        mock_tk.Canvas = MagicMock(return_value=MagicMock())
-        mock_tk.Frame = MagicMock(return_value=MagicMock())
-        mock_tk.Label = MagicMock(return_value=MagicMock())
-        mock_tk.Button = MagicMock(return_value=MagicMock())
-        mock_tk.TclError = Exception
-        # Version attributes must be real numbers for comparison operations
-        mock_tk.TkVersion = 8.6
-        mock_tk.TclVersion = 8.6
-        # String constants
-        mock_tk.X = 'x'
-        mock_tk.Y = 'y'
-        mock_tk.BOTH = 'both'
-        mock_tk.LEFT = 'left'
-        mock_tk.RIGHT = 'right'
-        mock_tk.TOP = 'top'
-        mock_tk.BOTTOM = 'bottom'
-        mock_tk.VERTICAL = 'vertical'
-        mock_tk.FLAT = 'flat'
-        mock_tk.END = 'end'
-        mock_tk.NORMAL = 'normal'
-        mock_tk.DISABLED = 'disabled'
-        mock_tk.WORD = 'word'
-        mock_tk.NONE = 'none'
-        sys.modules['_tkinter'] = MagicMock()
-        sys.modules['tkinter'] = mock_tk
-        sys.modules['tkinter.ttk'] = MagicMock()
+        tkinter_c_stub, tk_stub, ttk_stub = _build_tkinter_stubs()
+        sys.modules.setdefault('_tkinter', tkinter_c_stub)
+        sys.modules.setdefault('tkinter', tk_stub)
+        sys.modules.setdefault('tkinter.ttk', ttk_stub)
 
     # Mock macOS-specific modules if not on macOS
     if sys.platform != 'darwin':
@@ -151,54 +175,83 @@ def _protect_logging_handlers():
     attributes (like 'level') with MagicMock objects, causing TypeError when
     Python's logging module tries to compare log levels.
 
-    This fixture ensures all handlers have proper integer levels before and
-    after each test.
+    This fixture repairs any handler left with a non-integer level after
+    each test. Corruption can only come from a test, so checking once after
+    the test (rather than before and after) is enough.
     """
-    def _fix_handler_levels():
-        """Ensure all logging handlers have integer levels."""
-        for handler in logging.root.handlers[:]:
-            if not isinstance(handler.level, int):
-                handler.level = logging.NOTSET
-        # Also fix levels on named loggers
-        for name in list(logging.Logger.manager.loggerDict.keys()):
-            logger = logging.getLogger(name)
-            for handler in logger.handlers[:]:
+    yield
+
+    for handler in logging.root.handlers:
+        if not isinstance(handler.level, int):
+            handler.level = logging.NOTSET
+    # Also fix levels on named loggers; PlaceHolder entries have no handlers
+    for logger in logging.Logger.manager.loggerDict.values():
+        if isinstance(logger, logging.Logger):
+            for handler in logger.handlers:
                 if not isinstance(handler.level, int):
                     handler.level = logging.NOTSET
 
-    _fix_handler_levels()
-    yield
-    _fix_handler_levels()
-
 
 # =============================================================================
 # CACHED TEST DATA GENERATION
 # =============================================================================
 
-@lru_cache(maxsize=16)
+# numpy is imported on first use so that collecting tests which never touch
+# audio does not pay for loading it.
+
+@lru_cache(maxsize=None)
+def _np():
+    """Return the numpy module, importing it on first call."""
+    import numpy
+    return numpy
+
+
+# WAV bytes keyed by (duration in ms, sample rate). Millisecond keys keep
+# float durations such as 0.1 and 0.1000001 from generating separate copies.
+_AUDIO_CACHE = {}
+
+
+def _build_wav(duration_ms: int, sample_rate: int) -> bytes:
+    """Encode a 440 Hz tone as 16-bit mono PCM WAV bytes."""
+    np = _np()
+
+    # Generate simple sine wave (440 Hz tone) in a single buffer
+    n_samples = sample_rate * duration_ms // 1000
+    samples = np.arange(n_samples, dtype=np.float32)
+    samples *= 2 * np.pi * 440.0 / sample_rate
+    np.sin(samples, out=samples)
+    samples *= 32767.0
+    pcm = samples.astype(np.int16).tobytes()
+
+    # Encode as 16-bit mono PCM WAV
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + len(pcm), b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", len(pcm),
+    )
+    return header + pcm
+
+
 def create_test_audio(duration_sec: float = 1.0, sample_rate: int = 16000) -> bytes:
     """
     Create valid WAV audio bytes (cached for performance).
 
-    This function is cached because test audio generation involves expensive
-    numpy operations and WAV encoding. Most tests use the same audio parameters.
+    Audio is generated once per (duration, sample rate) and reused, since
+    most tests use the same parameters.
 
     Args:
-        duration_sec: Duration of audio in seconds.
+        duration_sec: Duration of audio in seconds (millisecond resolution).
         sample_rate: Sample rate in Hz.
 
     Returns:
         WAV file as bytes.
     """
-    # Generate simple sine wave (440 Hz tone)
-    t = np.linspace(0, duration_sec, int(sample_rate * duration_sec))
-    audio_data = (np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
-
-    # Encode as WAV
-    wav_buffer = io.BytesIO()
-    wavfile.write(wav_buffer, sample_rate, audio_data)
-    wav_buffer.seek(0)
-    return wav_buffer.getvalue()
+    key = (round(duration_sec * 1000), sample_rate)
+    wav = _AUDIO_CACHE.get(key)
+    if wav is None:
+        wav = _AUDIO_CACHE[key] = _build_wav(*key)
+    return wav
 
 
 # =============================================================================
@@ -206,7 +259,7 @@ def create_test_audio(duration_sec: float = 1.0, sample_rate: int = 16000) -> by
 # =============================================================================
 
 @pytest.fixture(scope="session")
-def groq_api_key_env(session_mocker):
+def groq_api_key_env():
     """
     Session-scoped fixture to set GROQ_API_KEY environment variable.
 
@@ -223,27 +276,21 @@ def groq_api_key_env(session_mocker):
 
 
 @pytest.fixture(scope="session")
-def session_mocker():
-    """Session-scoped mocker placeholder for compatibility."""
-    yield
-
-
-# =============================================================================
-# FUNCTION-SCOPED FIXTURES (for tests that need fresh state)
-# =============================================================================
-
-@pytest.fixture
 def test_audio():
     """Provide cached test audio bytes (1 second duration)."""
     return create_test_audio(1.0, 16000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_audio_short():
     """Provide cached short test audio bytes (0.1 second)."""
     return create_test_audio(0.1, 16000)
 
 
+# =============================================================================
+# FUNCTION-SCOPED FIXTURES (for tests that need fresh state)
+# =============================================================================
+
 @pytest.fixture
 def mock_groq_env(monkeypatch):
     """Set up GROQ_API_KEY environment variable for a single test."""
@@ -254,8 +301,8 @@ def mock_groq_env(monkeypatch):
 # HARDWARE DETECTION FIXTURES
 # =============================================================================
 
-@pytest.fixture(scope="session")
-def has_microphone() -> bool:
+@lru_cache(maxsize=None)
+def _has_microphone() -> bool:
     """Check if a microphone is available."""
     try:
         import sounddevice as sd
@@ -266,24 +313,16 @@ def has_microphone() -> bool:
         return False
 
 
-@pytest.fixture(scope="session")
-def has_whisper_model() -> bool:
+@lru_cache(maxsize=None)
+def _has_whisper_model() -> bool:
     """Check if whisper.cpp model is available."""
     from pathlib import Path
     model_path = Path.home() / ".cache" / "whisper" / "ggml-base.en.bin"
     return model_path.exists()
 
 
-@pytest.fixture(scope="session")
-def is_ci_environment() -> bool:
-    """Check if running in CI environment."""
-    import os
-    ci_vars = ["CI", "GITHUB_ACTIONS", "GITLAB_CI", "JENKINS_URL"]
-    return any(os.environ.get(var) for var in ci_vars)
-
-
-@pytest.fixture(scope="session")
-def has_accessibility_permission() -> bool:
+@lru_cache(maxsize=None)
+def _has_accessibility_permission() -> bool:
     """Check if accessibility permission is granted (macOS)."""
     if sys.platform != "darwin":
         return True
@@ -298,21 +337,65 @@ def has_accessibility_permission() -> bool:
         return False
 
 
+@pytest.fixture(scope="session")
+def has_microphone() -> bool:
+    """Check if a microphone is available."""
+    return _has_microphone()
+
+
+@pytest.fixture(scope="session")
+def has_whisper_model() -> bool:
+    """Check if whisper.cpp model is available."""
+    return _has_whisper_model()
+
+
+@pytest.fixture(scope="session")
+def is_ci_environment() -> bool:
+    """Check if running in CI environment."""
+    import os
+    ci_vars = ["CI", "GITHUB_ACTIONS", "GITLAB_CI", "JENKINS_URL"]
+    return any(os.environ.get(var) for var in ci_vars)
+
+
+@pytest.fixture(scope="session")
+def has_accessibility_permission() -> bool:
+    """Check if accessibility permission is granted (macOS)."""
+    return _has_accessibility_permission()
+
+
 # =============================================================================
-# AUTO-SKIP FIXTURES
+# AUTO-SKIP BY MARKER
 # =============================================================================
 
-@pytest.fixture(autouse=True)
-def _auto_skip_by_marker(request, has_microphone, has_whisper_model, has_accessibility_permission):
-    """Automatically skip tests based on markers."""
-    if request.node.get_closest_marker("requires_microphone") and not has_microphone:
-        pytest.skip("No microphone available")
+def _hypothesis_enabled() -> bool:
+    """Property tests run unless SKIP_HYPOTHESIS is set (fast local/CI lane)."""
+    import os
+    return not os.environ.get("SKIP_HYPOTHESIS")
+
 
-    if request.node.get_closest_marker("requires_whisper") and not has_whisper_model:
-        pytest.skip("Whisper model not downloaded")
+# marker -> (capability check, skip reason). Hypothesis's pytest plugin marks
+# every @given test with "hypothesis", so that entry covers all property tests.
+_MARKER_REQUIREMENTS = {
+    "requires_microphone": (_has_microphone, "No microphone available"),
+    "requires_whisper": (_has_whisper_model, "Whisper model not downloaded"),
+    "requires_macos": (lambda: sys.platform == "darwin", "Test requires macOS"),
+    "requires_accessibility": (_has_accessibility_permission, "Accessibility permission not granted"),
+    "hypothesis": (_hypothesis_enabled, "SKIP_HYPOTHESIS is set"),
+}
 
-    if request.node.get_closest_marker("requires_macos") and sys.platform != "darwin":
-        pytest.skip("Test requires macOS")
 
-    if request.node.get_closest_marker("requires_accessibility") and not has_accessibility_permission:
-        pytest.skip("Accessibility permission not granted")
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests whose required capability is missing.
+
+    Runs once after collection, after plugins (hypothesis) have added their
+    markers. Each capability is checked only if some collected test carries
+    its marker, and unmarked tests cost nothing.
+    """
+    for marker, (check, reason) in _MARKER_REQUIREMENTS.items():
+        marked = [item for item in items if item.get_closest_marker(marker)]
+        if marked and not check():
+            skip = pytest.mark.skip(reason=reason)
+            for item in marked:
+                item.add_marker(skip)
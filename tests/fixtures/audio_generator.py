@@ -14,8 +14,8 @@ import sys
 import tempfile
 from pathlib import Path
 
-import numpy as np
-from scipy.io import wavfile
+# numpy and scipy are imported inside the generators so that importing this
+# module (e.g. during test collection) stays cheap.
 
 FIXTURES_DIR = Path(__file__).parent / "audio"
 SAMPLE_RATE = 16000
@@ -31,6 +31,9 @@ def generate_silence(filename: str, duration_sec: float) -> Path:
     Returns:
         Path to generated file.
     """
+    import numpy as np
+    from scipy.io import wavfile
+
     output = FIXTURES_DIR / filename
     samples = int(SAMPLE_RATE * duration_sec)
     audio = np.zeros(samples, dtype=np.int16)
@@ -50,6 +53,9 @@ def generate_noise(filename: str, duration_sec: float, level: float = 0.05) -> P
     Returns:
         Path to generated file.
     """
+    import numpy as np
+    from scipy.io import wavfile
+
     output = FIXTURES_DIR / filename
     samples = int(SAMPLE_RATE * duration_sec)
     audio = (np.random.randn(samples) * 32767 * level).astype(np.int16)
@@ -69,6 +75,9 @@ def generate_tone(filename: str, duration_sec: float, frequency: float = 440.0)
     Returns:
         Path to generated file.
     """
+    import numpy as np
+    from scipy.io import wavfile
+
     output = FIXTURES_DIR / filename
     samples = int(SAMPLE_RATE * duration_sec)
     t = np.linspace(0, duration_sec, samples, dtype=np.float32)
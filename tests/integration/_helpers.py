@@ -0,0 +1,68 @@
+"""Plain helpers shared by the integration tests and their fixtures."""
+
+import json
+import struct
+from functools import lru_cache
+from pathlib import Path
+
+
+AUDIO_FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "audio"
+
+
+@lru_cache(maxsize=None)
+def load_manifest() -> dict:
+    """Parse manifest.json once per process (collection and fixtures share it)."""
+    manifest_path = AUDIO_FIXTURES_DIR / "manifest.json"
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text())
+    return {"fixtures": []}
+
+
+def manifest_fixtures() -> list:
+    """Manifest entries, for use with pytest.mark.parametrize."""
+    return load_manifest().get("fixtures", [])
+
+
+def count_visible(text: str, limit: int) -> int:
+    """Count non-whitespace characters in text, stopping once limit is reached."""
+    count = 0
+    for char in text:
+        if not char.isspace():
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+
+def wav_meta(path: Path):
+    """
+    Read (sample_rate, n_frames, header) from a WAV file's chunk headers.
+
+    header is the file's first 12 bytes. Chunk headers are read into one
+    small fixed buffer and every chunk body is seeked past, so at most ~60
+    bytes are read however long the file is. rate and n_frames are None
+    when the file is not RIFF/WAVE (e.g. a Git LFS pointer).
+    """
+    buf = bytearray(16)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        header = bytes(view[:f.readinto(view[:12])])
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None, None, header
+        rate = block_align = None
+        while f.readinto(view[:8]) == 8:
+            chunk_id, size = struct.unpack_from("<4sI", buf)
+            # Chunks are word-aligned; skip any padding byte too
+            padded = size + (size & 1)
+            if chunk_id == b"fmt ":
+                if size < 14 or f.readinto(view[:14]) != 14:
+                    break
+                _, _, rate, _, block_align = struct.unpack_from("<HHIIH", buf)
+                f.seek(padded - 14, 1)
+            elif chunk_id == b"data":
+                if rate is None:
+                    break
+                return rate, size // block_align, header
+            else:
+                f.seek(padded, 1)
+    return None, None, header
@@ -1,23 +1,35 @@
 """Integration test fixtures."""
 
-import json
+import io
+import time
+
 import pytest
 from pathlib import Path
 
+from ._helpers import AUDIO_FIXTURES_DIR, load_manifest, wav_meta
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def audio_fixtures_dir() -> Path:
     """Path to audio fixtures directory."""
-    return Path(__file__).parent.parent / "fixtures" / "audio"
+    return AUDIO_FIXTURES_DIR
 
 
-@pytest.fixture
-def fixture_manifest(audio_fixtures_dir):
-    """Load fixture manifest."""
-    manifest_path = audio_fixtures_dir / "manifest.json"
-    if manifest_path.exists():
-        return json.loads(manifest_path.read_text())
-    return {"fixtures": []}
+@pytest.fixture(scope="session")
+def fixture_manifest():
+    """Load fixture manifest (parsed once per session)."""
+    return load_manifest()
+
+
+@pytest.fixture(scope="session")
+def fixture_paths(audio_fixtures_dir):
+    """
+    Map of WAV fixture filename to path, built from one directory scan.
+
+    Tests look fixtures up here instead of stat-ing each path; a missing
+    key means the fixture does not exist.
+    """
+    return {p.name: p for p in audio_fixtures_dir.glob("*.wav")}
 
 
 @pytest.fixture
@@ -26,3 +38,102 @@ def get_fixture_path(audio_fixtures_dir):
     def _get(filename: str) -> Path:
         return audio_fixtures_dir / filename
     return _get
+
+
+@pytest.fixture(scope="session")
+def session_transcriber():
+    """
+    LocalTranscriber shared by every whisper test in the session.
+
+    Loading the ggml model is the slow part of these tests, so it is done
+    once instead of per test. Do not call it from several threads: the
+    whisper.cpp context is not thread-safe, and each inference already runs
+    on up to 4 native threads.
+    """
+    from context_aware_whisper.local_transcriber import LocalTranscriber
+    return LocalTranscriber(model_name="base.en")
+
+
+@pytest.fixture(scope="session")
+def long_recording():
+    """
+    One 2s microphone recording, shared by the session.
+
+    Returns (wav_bytes, rate, data), parsed once. AudioRecorder captures in
+    real time, so tests that only inspect a recording reuse this one instead
+    of each sleeping through their own.
+    """
+    from scipy.io import wavfile
+    from context_aware_whisper.audio_recorder import AudioRecorder
+
+    recorder = AudioRecorder(sample_rate=16000, channels=1)
+    recorder.start_recording()
+    time.sleep(2.0)
+    wav_bytes = recorder.stop_recording()
+    rate, data = wavfile.read(io.BytesIO(wav_bytes))
+    return wav_bytes, rate, data
+
+
+@pytest.fixture(scope="session")
+def audio_bytes():
+    """
+    Read audio fixture files at most once per session.
+
+    Returns a callable mapping a path to its contents. Entries are keyed by
+    mtime so a regenerated fixture is read again.
+    """
+    cache = {}
+
+    def _get(path: Path) -> bytes:
+        key = (path, path.stat().st_mtime_ns)
+        if key not in cache:
+            cache[key] = path.read_bytes()
+        return cache[key]
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def wav_cache():
+    """
+    Read audio fixture WAV headers at most once per session.
+
+    Returns a callable mapping a WAV path to wav_meta()'s (rate, n_frames,
+    header). Only the chunk headers are read, never the samples. Entries are
+    keyed by mtime so a regenerated fixture is read again.
+    """
+    cache = {}
+
+    def _read(path: Path):
+        key = (path, path.stat().st_mtime_ns)
+        if key not in cache:
+            cache[key] = wav_meta(path)
+        return cache[key]
+
+    return _read
+
+
+@pytest.fixture(scope="session")
+def original_clipboard():
+    """
+    Save the clipboard once per session and restore it at the end.
+
+    Only tests that write to the real clipboard request it (via
+    usefixtures); probing it once instead of around every test avoids a
+    pbpaste/pbcopy spawn pair per test.
+    """
+    try:
+        import pyperclip
+    except ImportError:
+        yield ""
+        return
+
+    try:
+        original = pyperclip.paste()
+    except Exception:
+        original = ""
+    yield original
+    try:
+        pyperclip.copy(original)
+    except Exception:
+        pass
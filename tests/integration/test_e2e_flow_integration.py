@@ -2,6 +2,14 @@
 
 import pytest
 
+from ._helpers import count_visible
+
+try:
+    from context_aware_whisper.audio_recorder import AudioRecorder
+    from context_aware_whisper.output_handler import OutputHandler
+except (ImportError, OSError) as e:
+    pytest.skip(f"context_aware_whisper unavailable: {e}", allow_module_level=True)
+
 try:
     import pyperclip
     PYPERCLIP_AVAILABLE = True
@@ -11,38 +19,18 @@ except ImportError:
 
 @pytest.mark.integration
 @pytest.mark.requires_whisper
+@pytest.mark.usefixtures("original_clipboard")
 class TestE2EFlow:
     """End-to-end flow tests requiring whisper model."""
 
-    @pytest.fixture(autouse=True)
-    def preserve_clipboard(self):
-        """Preserve and restore clipboard contents around tests."""
-        if not PYPERCLIP_AVAILABLE:
-            yield
-            return
-
-        try:
-            original = pyperclip.paste()
-        except Exception:
-            original = ""
-        yield
-        try:
-            pyperclip.copy(original)
-        except Exception:
-            pass
-
-    def test_audio_file_to_clipboard(self, audio_fixtures_dir):
+    def test_audio_file_to_clipboard(self, fixture_paths, session_transcriber, audio_bytes):
         """Test complete flow: audio file -> transcription -> clipboard."""
-        from context_aware_whisper.local_transcriber import LocalTranscriber
-        from context_aware_whisper.output_handler import OutputHandler
-
-        audio_path = audio_fixtures_dir / "hello_world.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("hello_world.wav")
+        if audio_path is None:
             pytest.skip("Fixture hello_world.wav not found")
 
         # Transcribe
-        transcriber = LocalTranscriber(model_name="base.en")
-        text = transcriber.transcribe(audio_path.read_bytes())
+        text = session_transcriber.transcribe(audio_bytes(audio_path))
 
         # Note: tone fallback fixtures may produce empty transcription
         # Just verify the flow works without error
@@ -57,49 +45,37 @@ class TestE2EFlow:
         if PYPERCLIP_AVAILABLE and text:
             assert pyperclip.paste() == text
 
-    def test_silence_produces_minimal_output(self, audio_fixtures_dir):
+    def test_silence_produces_minimal_output(self, fixture_paths, session_transcriber, audio_bytes):
         """Test that silence audio doesn't produce false transcriptions."""
-        from context_aware_whisper.local_transcriber import LocalTranscriber
-
-        audio_path = audio_fixtures_dir / "silence.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("silence.wav")
+        if audio_path is None:
             pytest.skip("Fixture silence.wav not found")
 
-        transcriber = LocalTranscriber(model_name="base.en")
-        text = transcriber.transcribe(audio_path.read_bytes())
+        text = session_transcriber.transcribe(audio_bytes(audio_path))
 
         # Silence should produce very little or no output
-        assert len(text.strip()) < 30, \
+        assert count_visible(text, 30) < 30, \
             f"Silence produced unexpected output: {text}"
 
 
 @pytest.mark.integration
 @pytest.mark.requires_whisper
 @pytest.mark.requires_microphone
+@pytest.mark.usefixtures("original_clipboard")
 class TestE2EWithRecording:
     """End-to-end tests requiring both microphone and whisper."""
 
-    def test_record_transcribe_clipboard(self, audio_fixtures_dir):
+    def test_record_transcribe_clipboard(self, session_transcriber, long_recording):
         """Test complete flow: mic recording -> transcription -> clipboard.
 
         Note: This test records actual audio, so results depend on environment.
         """
-        import time
-        from context_aware_whisper.audio_recorder import AudioRecorder
-        from context_aware_whisper.local_transcriber import LocalTranscriber
-        from context_aware_whisper.output_handler import OutputHandler
-
-        # Record
-        recorder = AudioRecorder(sample_rate=16000, channels=1)
-        recorder.start_recording()
-        time.sleep(1.0)  # Record 1 second
-        wav_bytes = recorder.stop_recording()
+        wav_bytes, _, _ = long_recording
 
         assert wav_bytes[:4] == b'RIFF', "Invalid WAV from recording"
 
         # Transcribe
-        transcriber = LocalTranscriber(model_name="base.en")
-        text = transcriber.transcribe(wav_bytes)
+        text = session_transcriber.transcribe(wav_bytes)
 
         # Result depends on what was recorded - just verify it runs
         assert isinstance(text, str)
@@ -115,8 +91,6 @@ class TestStateTransitions:
 
     def test_idle_to_recording_state(self):
         """Test transition from IDLE to RECORDING."""
-        from context_aware_whisper.audio_recorder import AudioRecorder
-
         recorder = AudioRecorder()
 
         # Should start in not-recording state
@@ -132,8 +106,6 @@ class TestStateTransitions:
 
     def test_multiple_state_transitions(self):
         """Test multiple state transitions work correctly."""
-        from context_aware_whisper.audio_recorder import AudioRecorder
-
         recorder = AudioRecorder()
 
         for _ in range(3):
@@ -1,32 +1,34 @@
 """Integration tests for LocalTranscriber with whisper.cpp."""
 
 import time
+from pathlib import Path
 
 import pytest
 
+from ._helpers import count_visible, manifest_fixtures
+
+try:
+    from context_aware_whisper.local_transcriber import LocalTranscriber
+except (ImportError, OSError) as e:
+    pytest.skip(f"LocalTranscriber unavailable: {e}", allow_module_level=True)
+
 
 @pytest.mark.integration
 @pytest.mark.requires_whisper
 class TestLocalTranscriberIntegration:
     """Integration tests requiring whisper.cpp model."""
 
-    @pytest.fixture
-    def transcriber(self):
-        """Create a LocalTranscriber instance."""
-        from context_aware_whisper.local_transcriber import LocalTranscriber
-        return LocalTranscriber(model_name="base.en")
-
-    def test_transcribe_hello_world(self, transcriber, audio_fixtures_dir, fixture_manifest):
+    def test_transcribe_hello_world(self, session_transcriber, fixture_paths, fixture_manifest, audio_bytes):
         """Transcribe hello_world fixture and verify text."""
-        audio_path = audio_fixtures_dir / "hello_world.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("hello_world.wav")
+        if audio_path is None:
             pytest.skip("Fixture hello_world.wav not found")
 
         # Check if this is a TTS-generated fixture (has speech) or tone fallback
         fixtures = fixture_manifest.get("fixtures", [])
         fixture_info = next((f for f in fixtures if f["filename"] == "hello_world.wav"), None)
 
-        result = transcriber.transcribe(audio_path.read_bytes())
+        result = session_transcriber.transcribe(audio_bytes(audio_path))
 
         # If we have expected text and the fixture is speech, verify content
         if fixture_info and fixture_info.get("expected_text"):
@@ -47,64 +49,55 @@ class TestLocalTranscriberIntegration:
                 # Empty result from tone input is acceptable
                 assert isinstance(result, str)
 
-    def test_transcribe_silence(self, transcriber, audio_fixtures_dir):
+    def test_transcribe_silence(self, session_transcriber, fixture_paths, audio_bytes):
         """Silent audio should return empty or minimal text."""
-        audio_path = audio_fixtures_dir / "silence.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("silence.wav")
+        if audio_path is None:
             pytest.skip("Fixture silence.wav not found")
 
-        result = transcriber.transcribe(audio_path.read_bytes())
+        result = session_transcriber.transcribe(audio_bytes(audio_path))
 
         # Silence should produce very little output
-        assert len(result.strip()) < 20, \
+        assert count_visible(result, 20) < 20, \
             f"Silence produced too much text: {result}"
 
-    def test_transcribe_short_phrase(self, transcriber, audio_fixtures_dir):
+    def test_transcribe_short_phrase(self, session_transcriber, fixture_paths, audio_bytes):
         """Transcribe short_phrase fixture."""
-        audio_path = audio_fixtures_dir / "short_phrase.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("short_phrase.wav")
+        if audio_path is None:
             pytest.skip("Fixture short_phrase.wav not found")
 
-        result = transcriber.transcribe(audio_path.read_bytes())
+        result = session_transcriber.transcribe(audio_bytes(audio_path))
 
         # Tone fallbacks produce empty/minimal output; real TTS would have words
         # Just verify transcription runs without error
         assert isinstance(result, str)
 
-    def test_latency_acceptable(self, transcriber, audio_fixtures_dir):
+    def test_latency_acceptable(self, session_transcriber, fixture_paths, audio_bytes):
         """Transcription should complete within reasonable time."""
-        audio_path = audio_fixtures_dir / "hello_world.wav"
-        if not audio_path.exists():
+        audio_path = fixture_paths.get("hello_world.wav")
+        if audio_path is None:
             pytest.skip("Fixture hello_world.wav not found")
 
-        audio_bytes = audio_path.read_bytes()
+        wav = audio_bytes(audio_path)
 
         start = time.time()
-        transcriber.transcribe(audio_bytes)
+        session_transcriber.transcribe(wav)
         elapsed = time.time() - start
 
         # Should complete within 3 seconds for short audio
         assert elapsed < 3.0, f"Transcription took {elapsed:.2f}s (expected < 3s)"
 
     @pytest.mark.slow
-    def test_transcribe_all_fixtures(self, transcriber, fixture_manifest, audio_fixtures_dir):
-        """Test all fixtures from manifest - verify transcription runs."""
-        fixtures = fixture_manifest.get("fixtures", [])
-        if not fixtures:
-            pytest.skip("No fixtures in manifest")
-
-        processed = 0
-        for fixture in fixtures:
-            audio_path = audio_fixtures_dir / fixture["filename"]
-            if not audio_path.exists():
-                continue
-
-            # Just verify transcription runs without error for each fixture
-            result = transcriber.transcribe(audio_path.read_bytes())
-            assert isinstance(result, str), f"{fixture['filename']}: expected string result"
-            processed += 1
+    @pytest.mark.parametrize("fixture", manifest_fixtures(), ids=lambda f: f["filename"])
+    def test_transcribe_fixture(self, session_transcriber, fixture, fixture_paths, audio_bytes):
+        """Each manifest fixture should transcribe without error."""
+        audio_path = fixture_paths.get(fixture["filename"])
+        if audio_path is None:
+            pytest.skip(f"{fixture['filename']} not found")
 
-        assert processed > 0, "No fixtures were processed"
+        result = session_transcriber.transcribe(audio_bytes(audio_path))
+        assert isinstance(result, str), f"{fixture['filename']}: expected string result"
 
 
 @pytest.mark.integration
@@ -113,15 +106,10 @@ class TestLocalTranscriberUnit:
 
     def test_import_local_transcriber(self):
         """Test LocalTranscriber can be imported."""
-        try:
-            from context_aware_whisper.local_transcriber import LocalTranscriber
-            assert LocalTranscriber is not None
-        except ImportError as e:
-            pytest.skip(f"LocalTranscriber not available: {e}")
+        assert LocalTranscriber is not None
 
     def test_model_path_detection(self):
         """Test model path detection logic."""
-        from pathlib import Path
         model_path = Path.home() / ".cache" / "whisper" / "ggml-base.en.bin"
         # Just verify path construction works
         assert model_path.parts[-1] == "ggml-base.en.bin"
@@ -2,6 +2,11 @@
 
 import pytest
 
+try:
+    from context_aware_whisper.output_handler import OutputHandler
+except (ImportError, OSError) as e:
+    pytest.skip(f"OutputHandler unavailable: {e}", allow_module_level=True)
+
 try:
     import pyperclip
     PYPERCLIP_AVAILABLE = True
@@ -10,30 +15,12 @@ except ImportError:
 
 
 @pytest.mark.integration
+@pytest.mark.usefixtures("original_clipboard")
 class TestClipboardIntegration:
     """Integration tests for clipboard operations."""
 
-    @pytest.fixture(autouse=True)
-    def preserve_clipboard(self):
-        """Preserve and restore clipboard contents around tests."""
-        if not PYPERCLIP_AVAILABLE:
-            yield
-            return
-
-        try:
-            original = pyperclip.paste()
-        except Exception:
-            original = ""
-        yield
-        try:
-            pyperclip.copy(original)
-        except Exception:
-            pass
-
     def test_clipboard_roundtrip_basic(self):
         """Test basic clipboard copy/paste roundtrip."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         test_text = "Hello, this is a test!"
 
@@ -44,8 +31,6 @@ class TestClipboardIntegration:
 
     def test_clipboard_roundtrip_unicode(self):
         """Test clipboard preserves unicode characters."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         test_text = "Hello cafe 2+2=4 Japanese: konnichiwa"
 
@@ -59,8 +44,6 @@ class TestClipboardIntegration:
 
     def test_clipboard_empty_string(self):
         """Test clipboard handles empty string without error."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         # Should not raise an error when copying empty string
         handler.copy_to_clipboard("")
@@ -75,8 +58,6 @@ class TestClipboardIntegration:
 
     def test_clipboard_whitespace(self):
         """Test clipboard preserves whitespace."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         test_text = "  spaced  text  "
 
@@ -87,8 +68,6 @@ class TestClipboardIntegration:
 
     def test_clipboard_multiline(self):
         """Test clipboard handles multiline text."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         test_text = "Line 1\nLine 2\nLine 3"
 
@@ -108,8 +87,6 @@ class TestTypeTextIntegration:
 
     def test_type_text_available(self):
         """Test that type_text method exists and is callable."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         assert hasattr(handler, 'type_text') or hasattr(handler, 'type_text_instant')
 
@@ -120,15 +97,11 @@ class TestOutputHandlerUnit:
 
     def test_output_handler_initialization(self):
         """Test OutputHandler can be instantiated."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         assert handler is not None
 
     def test_output_handler_has_copy_method(self):
         """Test OutputHandler has copy_to_clipboard method."""
-        from context_aware_whisper.output_handler import OutputHandler
-
         handler = OutputHandler()
         assert hasattr(handler, 'copy_to_clipboard')
         assert callable(handler.copy_to_clipboard)
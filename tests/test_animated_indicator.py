@@ -10,35 +10,48 @@ including:
 - Integration with state transitions
 """
 
+import re
+from types import SimpleNamespace
+
 import pytest
-from hypothesis import given, settings, strategies as st, HealthCheck
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import call
+
+from context_aware_whisper.ui import indicator as indicator_module
+from context_aware_whisper.ui.indicator import RecordingIndicator
+
+from ._helpers import create_indicator_with_mocks, reset_indicator
+
+# #RRGGBB color string
+HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{6}\Z')
 
 
 # =============================================================================
-# HELPER FUNCTIONS
+# FIXTURES
 # =============================================================================
 
-def create_mock_tkinter():
-    """Create comprehensive tkinter mocks for indicator testing."""
-    mock_window = MagicMock()
-    mock_window.winfo_screenwidth.return_value = 1920
-    mock_window.winfo_screenheight.return_value = 1080
-    mock_window.winfo_vrootx.return_value = 0
-    mock_window.winfo_vrooty.return_value = 0
-    mock_canvas = MagicMock()
-    return mock_window, mock_canvas
+def frame_moves(mock_canvas):
+    """Item IDs moved by the batched Tcl coords script of the last frame."""
+    if not mock_canvas.tk.eval.called:
+        return []
+    script = mock_canvas.tk.eval.call_args[0][0]
+    return [int(line.split()[2]) for line in script.split("\n")]
+
 
+@pytest.fixture(scope="module")
+def shared_indicator():
+    """
+    One default RecordingIndicator for the module, built against mocked tkinter.
 
-def create_indicator_with_mocks(position="top-center", width=60, height=24):
-    """Create a RecordingIndicator with mocked tkinter."""
-    mock_window, mock_canvas = create_mock_tkinter()
+    Returns (indicator, mock_window, mock_canvas). Tests get it through
+    indicator_with_mocks or reset_indicator, which restore a fresh state.
+    """
+    return create_indicator_with_mocks()
 
-    with patch('context_aware_whisper.ui.indicator.tk.Toplevel', return_value=mock_window), \
-         patch('context_aware_whisper.ui.indicator.tk.Canvas', return_value=mock_canvas):
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        indicator = RecordingIndicator(width=width, height=height, position=position)
-        return indicator, mock_window, mock_canvas
+
+@pytest.fixture
+def indicator_with_mocks(shared_indicator):
+    """Shared indicator reset for this test: (indicator, mock_window, mock_canvas)."""
+    return reset_indicator(shared_indicator)
 
 
 # =============================================================================
@@ -48,53 +61,56 @@ def create_indicator_with_mocks(position="top-center", width=60, height=24):
 class TestBarAnimationConstants:
     """Tests for bar animation configuration constants."""
 
-    def test_bar_count_is_four(self):
-        """Verify BAR_COUNT is set to 4 as per spec."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_COUNT == 4
-
-    def test_bar_width_is_six_pixels(self):
-        """Verify BAR_WIDTH is 6 pixels."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_WIDTH == 6
-
-    def test_bar_gap_is_three_pixels(self):
-        """Verify BAR_GAP is 3 pixels."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_GAP == 3
-
-    def test_bar_min_height_is_four_pixels(self):
-        """Verify BAR_MIN_HEIGHT is 4 pixels."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_MIN_HEIGHT == 4
-
-    def test_bar_max_height_is_sixteen_pixels(self):
-        """Verify BAR_MAX_HEIGHT is 16 pixels."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_MAX_HEIGHT == 16
-
-    def test_bar_animation_interval_approx_12_fps(self):
-        """Verify BAR_ANIMATION_INTERVAL_MS is ~80ms (~12.5 FPS)."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_ANIMATION_INTERVAL_MS == 80
-
-    def test_bar_colors_has_four_colors(self):
-        """Verify BAR_COLORS has exactly 4 colors."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
+    @pytest.mark.parametrize("attr, expected", [
+        ("BAR_COUNT", 4),
+        ("BAR_WIDTH", 6),
+        ("BAR_GAP", 3),
+        ("BAR_MIN_HEIGHT", 4),
+        ("BAR_MAX_HEIGHT", 16),
+        ("BAR_ANIMATION_INTERVAL_MS", 80),  # ~12.5 FPS
+        ("BAR_TOTAL_WIDTH", 33),  # 4 bars, 3 gaps
+        ("BAR_X_OFFSETS", (0, 9, 18, 27)),  # 6px bars, 3px gaps
+        ("BAR_FILLS", ("#FF3B30", "#FF6B5B", "#FF9500", "#FF6B5B")),
+        ("BAR_BG_COLOR", "#1C1C1E"),  # dark slate
+    ])
+    def test_bar_constant(self, attr, expected):
+        """Verify each bar animation constant matches the spec."""
+        assert getattr(RecordingIndicator, attr) == expected
+
+    def test_bar_colors_are_four_valid_hex(self):
+        """Verify BAR_COLORS has exactly 4 valid #RRGGBB hex strings."""
         assert len(RecordingIndicator.BAR_COLORS) == 4
+        assert all(
+            isinstance(color, str) and HEX_COLOR_RE.match(color)
+            for color in RecordingIndicator.BAR_COLORS
+        )
+
 
-    def test_bar_colors_are_valid_hex(self):
-        """Verify all BAR_COLORS are valid hex strings."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        for color in RecordingIndicator.BAR_COLORS:
-            assert isinstance(color, str)
-            assert color.startswith("#")
-            assert len(color) == 7  # #RRGGBB format
+class TestBarSteps:
+    """Tests for the precomputed bar step table."""
 
-    def test_bar_bg_color_is_dark(self):
-        """Verify BAR_BG_COLOR is the dark slate color."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-        assert RecordingIndicator.BAR_BG_COLOR == "#1C1C1E"
+    def test_bar_steps_within_step_range(self):
+        """Verify every precomputed step is between 2 and 5 pixels."""
+        assert indicator_module.BAR_STEPS
+        assert all(2 <= step <= 5 for step in indicator_module.BAR_STEPS)
+
+    def test_bar_steps_are_jittered(self):
+        """Verify the step table varies rather than repeating one value."""
+        assert len(set(indicator_module.BAR_STEPS)) > 1
+
+    def test_animate_bars_follows_step_table(self, indicator_with_mocks):
+        """Verify each bar advances by its next step from BAR_STEPS."""
+        indicator, _, _ = indicator_with_mocks
+        indicator._current_state = "recording"
+        indicator._bar_heights = [10, 10, 10, 10]
+        indicator._bar_directions = [1, 1, -1, -1]
+        indicator._bar_step_index = 0
+        steps = indicator_module.BAR_STEPS[:4]
+
+        indicator._animate_bars()
+
+        assert indicator._bar_heights == [10 + steps[0], 10 + steps[1], 10 - steps[2], 10 - steps[3]]
+        assert indicator._bar_step_index == 4
 
 
 # =============================================================================
@@ -104,21 +120,20 @@ class TestBarAnimationConstants:
 class TestBarAnimationStateInit:
     """Tests for bar animation state initialization."""
 
-    def test_bar_animation_id_starts_none(self):
+    def test_bar_animation_id_starts_none(self, indicator_with_mocks):
         """Verify _bar_animation_id starts as None."""
-        indicator, _, _ = create_indicator_with_mocks()
+        indicator, _, _ = indicator_with_mocks
         assert indicator._bar_animation_id is None
 
-    def test_bar_heights_initialized_to_min(self):
+    def test_bar_heights_initialized_to_min(self, indicator_with_mocks):
         """Verify _bar_heights are initialized to BAR_MIN_HEIGHT."""
-        indicator, _, _ = create_indicator_with_mocks()
-        from context_aware_whisper.ui.indicator import RecordingIndicator
+        indicator, _, _ = indicator_with_mocks
         expected = [RecordingIndicator.BAR_MIN_HEIGHT] * RecordingIndicator.BAR_COUNT
         assert indicator._bar_heights == expected
 
-    def test_bar_directions_are_alternating(self):
+    def test_bar_directions_are_alternating(self, indicator_with_mocks):
         """Verify _bar_directions alternate between 1 and -1."""
-        indicator, _, _ = create_indicator_with_mocks()
+        indicator, _, _ = indicator_with_mocks
         assert indicator._bar_directions == [1, -1, 1, -1]
 
 
@@ -129,18 +144,18 @@ class TestBarAnimationStateInit:
 class TestDrawRecordingBars:
     """Tests for _draw_recording_bars method."""
 
-    def test_draw_bars_clears_canvas(self):
+    def test_draw_bars_clears_canvas(self, indicator_with_mocks):
         """Verify _draw_recording_bars clears the canvas first."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.delete.reset_mock()
 
         indicator._draw_recording_bars()
 
         mock_canvas.delete.assert_called_with("all")
 
-    def test_draw_bars_creates_background_rectangle(self):
+    def test_draw_bars_creates_background_rectangle(self, indicator_with_mocks):
         """Verify _draw_recording_bars draws background rectangle."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.create_rectangle.reset_mock()
 
         indicator._draw_recording_bars()
@@ -152,9 +167,9 @@ class TestDrawRecordingBars:
         bg_call = calls[0]
         assert bg_call[1]['fill'] == indicator.BAR_BG_COLOR
 
-    def test_draw_bars_creates_four_bar_rectangles(self):
+    def test_draw_bars_creates_four_bar_rectangles(self, indicator_with_mocks):
         """Verify _draw_recording_bars creates 4 bar rectangles (plus background)."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.create_rectangle.reset_mock()
 
         indicator._draw_recording_bars()
@@ -163,9 +178,35 @@ class TestDrawRecordingBars:
         calls = mock_canvas.create_rectangle.call_args_list
         assert len(calls) == 5
 
-    def test_draw_bars_uses_bar_colors(self):
+    def test_redraw_moves_existing_bar_items(self, indicator_with_mocks):
+        """Verify drawing again reuses the bar items instead of recreating them."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        mock_canvas.create_rectangle.side_effect = range(100, 105)
+        indicator._draw_recording_bars()
+        mock_canvas.reset_mock()
+
+        indicator._draw_recording_bars()
+
+        mock_canvas.delete.assert_not_called()
+        mock_canvas.create_rectangle.assert_not_called()
+        moved = [c[0][0] for c in mock_canvas.coords.call_args_list]
+        assert moved == [101, 102, 103, 104]
+
+    def test_canvas_resize_discards_cached_items(self, indicator_with_mocks):
+        """Verify a <Configure> event makes the next draw recreate the items."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._draw_recording_bars()
+
+        indicator._on_canvas_configure(SimpleNamespace(width=100, height=40))
+        mock_canvas.reset_mock()
+        indicator._draw_recording_bars()
+
+        mock_canvas.delete.assert_called_with("all")
+        assert mock_canvas.create_rectangle.call_count == 5
+
+    def test_draw_bars_uses_bar_colors(self, indicator_with_mocks):
         """Verify bars are drawn with correct colors from BAR_COLORS."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.create_rectangle.reset_mock()
 
         indicator._draw_recording_bars()
@@ -176,7 +217,7 @@ class TestDrawRecordingBars:
         bar_colors_found = []
         for call_obj in calls:
             fill_color = call_obj[1].get('fill', call_obj[0][4] if len(call_obj[0]) > 4 else None)
-            if fill_color and fill_color in indicator.BAR_COLORS:
+            if fill_color and fill_color in indicator._BAR_COLORS_SET:
                 bar_colors_found.append(fill_color)
 
         # Should find 4 bar colors
@@ -193,37 +234,33 @@ class TestDrawRecordingBars:
 class TestAnimateBars:
     """Tests for _animate_bars method."""
 
-    def test_animate_bars_does_nothing_if_not_recording(self):
+    def test_animate_bars_does_nothing_if_not_recording(self, indicator_with_mocks):
         """Verify _animate_bars returns early if not in recording state."""
-        indicator, mock_window, mock_canvas = create_indicator_with_mocks()
+        indicator, mock_window, mock_canvas = indicator_with_mocks
         indicator._current_state = "idle"
 
-        # Store original heights
-        original_heights = indicator._bar_heights.copy()
-
         indicator._animate_bars()
 
         # Heights should not change
-        assert indicator._bar_heights == original_heights
+        assert indicator._bar_heights == [indicator.BAR_MIN_HEIGHT] * indicator.BAR_COUNT
         # No animation scheduled
         assert indicator._bar_animation_id is None
 
-    def test_animate_bars_updates_heights(self):
+    def test_animate_bars_updates_heights(self, indicator_with_mocks, monkeypatch):
         """Verify _animate_bars updates bar heights."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
+        monkeypatch.setattr(indicator_module, "BAR_STEPS", (3,))
         indicator._current_state = "recording"
-
-        # Store original heights
-        original_heights = indicator._bar_heights.copy()
+        indicator._bar_heights = [10, 10, 10, 10]
 
         indicator._animate_bars()
 
-        # At least some heights should have changed
-        assert indicator._bar_heights != original_heights or True  # Random might not change
+        # Each bar moves one step in its direction (up, down, up, down)
+        assert indicator._bar_heights == [13, 7, 13, 7]
 
-    def test_animate_bars_respects_min_height(self):
+    def test_animate_bars_respects_min_height(self, indicator_with_mocks):
         """Verify bar heights never go below BAR_MIN_HEIGHT."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._current_state = "recording"
         indicator._bar_heights = [indicator.BAR_MIN_HEIGHT] * 4
         indicator._bar_directions = [-1, -1, -1, -1]  # All going down
@@ -233,9 +270,9 @@ class TestAnimateBars:
         for height in indicator._bar_heights:
             assert height >= indicator.BAR_MIN_HEIGHT
 
-    def test_animate_bars_respects_max_height(self):
+    def test_animate_bars_respects_max_height(self, indicator_with_mocks):
         """Verify bar heights never go above BAR_MAX_HEIGHT."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._current_state = "recording"
         indicator._bar_heights = [indicator.BAR_MAX_HEIGHT] * 4
         indicator._bar_directions = [1, 1, 1, 1]  # All going up
@@ -245,9 +282,9 @@ class TestAnimateBars:
         for height in indicator._bar_heights:
             assert height <= indicator.BAR_MAX_HEIGHT
 
-    def test_animate_bars_reverses_direction_at_limits(self):
+    def test_animate_bars_reverses_direction_at_limits(self, indicator_with_mocks):
         """Verify bar directions reverse when hitting limits."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._current_state = "recording"
 
         # Set bars at max, direction up - should reverse
@@ -259,9 +296,47 @@ class TestAnimateBars:
         # All directions should now be -1
         assert all(d == -1 for d in indicator._bar_directions)
 
-    def test_animate_bars_schedules_next_frame(self):
+    @pytest.mark.parametrize("heights, directions", [
+        ([16, 4, 10, 10], [1, -1, 1, -1]),   # both limits, already there
+        ([15, 5, 10, 10], [1, -1, 1, -1]),   # both limits, overshooting
+        ([4, 16, 10, 10], [-1, 1, 1, -1]),   # both limits, bars swapped
+    ])
+    def test_animate_bars_bounces_at_both_limits_same_tick(
+        self, indicator_with_mocks, monkeypatch, heights, directions
+    ):
+        """Verify bars hitting the max and min in one frame both bounce."""
+        indicator, _, _ = indicator_with_mocks
+        monkeypatch.setattr(indicator_module, "BAR_STEPS", (3,))
+        indicator._current_state = "recording"
+        indicator._bar_heights = list(heights)
+        indicator._bar_directions = list(directions)
+
+        indicator._animate_bars()
+
+        for i in range(2):
+            limit = indicator.BAR_MAX_HEIGHT if directions[i] > 0 else indicator.BAR_MIN_HEIGHT
+            assert indicator._bar_heights[i] == limit
+            assert indicator._bar_directions[i] == -directions[i]
+        assert indicator._bar_heights[2:] == [13, 7]
+        assert indicator._bar_directions[2:] == directions[2:]
+
+    def test_animate_bars_skips_when_not_viewable(self, indicator_with_mocks):
+        """Verify a hidden indicator skips the frame and polls again at half rate."""
+        indicator, mock_window, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        indicator._bar_heights = [10, 10, 10, 10]
+        mock_window.winfo_viewable.return_value = False
+
+        indicator._animate_bars()
+
+        assert indicator._bar_heights == [10, 10, 10, 10]
+        mock_canvas.create_rectangle.assert_not_called()
+        mock_canvas.tk.eval.assert_not_called()
+        mock_window.after.assert_called_once_with(160, indicator._animate_bars)
+
+    def test_animate_bars_schedules_next_frame(self, indicator_with_mocks):
         """Verify _animate_bars schedules the next animation frame."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._current_state = "recording"
         mock_window.after.reset_mock()
 
@@ -273,9 +348,109 @@ class TestAnimateBars:
             indicator._animate_bars
         )
 
-    def test_animate_bars_stores_animation_id(self):
+    def test_animate_bars_moves_existing_bar_items(self, indicator_with_mocks):
+        """Verify _animate_bars resizes the bar items instead of recreating them."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        indicator._bar_heights = [10, 10, 10, 10]  # clear of both limits
+        mock_canvas.create_rectangle.side_effect = range(100, 105)
+        indicator._draw_recording_bars()
+        mock_canvas.reset_mock()
+
+        indicator._animate_bars()
+
+        mock_canvas.delete.assert_not_called()
+        mock_canvas.create_rectangle.assert_not_called()
+        assert frame_moves(mock_canvas) == [101, 102, 103, 104]
+
+    def test_bar_colors_set_once(self, indicator_with_mocks):
+        """Verify bar fills are set when the bars are created and never per frame."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        mock_canvas.create_rectangle.reset_mock()
+
+        indicator._draw_recording_bars()
+        for _ in range(10):
+            indicator._animate_bars()
+
+        fills = [c[1]["fill"] for c in mock_canvas.create_rectangle.call_args_list[1:]]
+        assert fills == [indicator.BAR_COLORS[i % len(indicator.BAR_COLORS)]
+                         for i in range(indicator.BAR_COUNT)]
+        mock_canvas.itemconfigure.assert_not_called()
+        mock_canvas.itemconfig.assert_not_called()
+
+    def test_animate_bars_skips_unchanged_bars(self, indicator_with_mocks):
+        """Verify bars pinned at a limit are not resized again."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        indicator._bar_heights = [indicator.BAR_MAX_HEIGHT, 10, indicator.BAR_MIN_HEIGHT, 10]
+        indicator._bar_directions = [1, 1, -1, -1]  # bars 0 and 2 push into their limit
+        mock_canvas.create_rectangle.side_effect = range(100, 105)
+        indicator._draw_recording_bars()
+        mock_canvas.reset_mock()
+
+        indicator._animate_bars()
+
+        assert frame_moves(mock_canvas) == [102, 104]
+
+    def test_animate_bars_single_flush_per_frame(self, indicator_with_mocks):
+        """Verify a frame sends all its bar moves to Tcl in one call."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        indicator._bar_heights = [10, 10, 10, 10]
+        indicator._draw_recording_bars()
+        mock_canvas.reset_mock()
+
+        indicator._animate_bars()
+
+        mock_canvas.tk.eval.assert_called_once()
+        mock_canvas.coords.assert_not_called()
+        script = mock_canvas.tk.eval.call_args[0][0]
+        expected = [
+            "{} coords {} {} {} {} {}".format(".!canvas", item_id, *indicator._bar_coords(i, h))
+            for i, (item_id, h) in enumerate(zip(indicator._bar_item_ids, indicator._bar_heights))
+        ]
+        assert script.split("\n") == expected
+
+    def test_animate_bars_leaves_redraw_to_event_loop(self, indicator_with_mocks):
+        """Verify a frame does not force a synchronous redraw."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._current_state = "recording"
+        mock_canvas.update_idletasks.reset_mock()
+
+        indicator._animate_bars()
+
+        mock_canvas.update_idletasks.assert_not_called()
+
+    def test_animate_bars_keeps_cadence_from_previous_deadline(self, indicator_with_mocks, monkeypatch):
+        """Verify time spent in a frame is taken off the next frame's delay."""
+        indicator, mock_window, _ = indicator_with_mocks
+        indicator._current_state = "recording"
+        monkeypatch.setattr(indicator_module.time, "monotonic", lambda: 100.03)
+        indicator._bar_frame_deadline = 100.0  # this frame was due 30ms ago
+
+        indicator._animate_bars()
+
+        mock_window.after.assert_called_with(50, indicator._animate_bars)
+
+    def test_animate_bars_overdue_frame_runs_when_idle(self, indicator_with_mocks, monkeypatch):
+        """Verify a frame that is already due is scheduled with after_idle."""
+        indicator, mock_window, _ = indicator_with_mocks
+        indicator._current_state = "recording"
+        monkeypatch.setattr(indicator_module.time, "monotonic", lambda: 100.5)
+        indicator._bar_frame_deadline = 100.0
+        mock_window.after.reset_mock()
+        mock_window.after_idle.return_value = "idle_id"
+
+        indicator._animate_bars()
+
+        mock_window.after_idle.assert_called_with(indicator._animate_bars)
+        mock_window.after.assert_not_called()
+        assert indicator._bar_animation_id == "idle_id"
+
+    def test_animate_bars_stores_animation_id(self, indicator_with_mocks):
         """Verify _animate_bars stores the animation callback ID."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._current_state = "recording"
         mock_window.after.return_value = "test_after_id"
 
@@ -291,27 +466,27 @@ class TestAnimateBars:
 class TestStopBarAnimation:
     """Tests for _stop_bar_animation method."""
 
-    def test_stop_bar_animation_cancels_callback(self):
+    def test_stop_bar_animation_cancels_callback(self, indicator_with_mocks):
         """Verify _stop_bar_animation cancels the pending callback."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._bar_animation_id = "test_id"
 
         indicator._stop_bar_animation()
 
         mock_window.after_cancel.assert_called_with("test_id")
 
-    def test_stop_bar_animation_clears_animation_id(self):
+    def test_stop_bar_animation_clears_animation_id(self, indicator_with_mocks):
         """Verify _stop_bar_animation sets animation ID to None."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._bar_animation_id = "test_id"
 
         indicator._stop_bar_animation()
 
         assert indicator._bar_animation_id is None
 
-    def test_stop_bar_animation_resets_bar_heights(self):
+    def test_stop_bar_animation_resets_bar_heights(self, indicator_with_mocks):
         """Verify _stop_bar_animation resets bar heights to minimum."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._bar_heights = [10, 12, 8, 14]
 
         indicator._stop_bar_animation()
@@ -319,15 +494,50 @@ class TestStopBarAnimation:
         expected = [indicator.BAR_MIN_HEIGHT] * indicator.BAR_COUNT
         assert indicator._bar_heights == expected
 
-    def test_stop_bar_animation_handles_none_id(self):
+    def test_stop_bar_animation_handles_none_id(self, indicator_with_mocks):
         """Verify _stop_bar_animation handles None animation ID gracefully."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._bar_animation_id = None
 
         # Should not raise
         indicator._stop_bar_animation()
 
         assert indicator._bar_animation_id is None
+        mock_window.after_cancel.assert_not_called()
+
+    def test_stop_bar_animation_reentrant_cancels_once(self, indicator_with_mocks):
+        """Verify a stop re-entered from after_cancel does not cancel the id again."""
+        indicator, mock_window, _ = indicator_with_mocks
+        indicator._bar_animation_id = "bar_id"
+        mock_window.after_cancel.side_effect = lambda _id: indicator._stop_bar_animation()
+
+        indicator._stop_bar_animation()
+
+        mock_window.after_cancel.assert_called_once_with("bar_id")
+        assert indicator._bar_animation_id is None
+
+    def test_stop_bar_animation_resets_heights_in_place(self, indicator_with_mocks):
+        """Verify stopping resets the existing heights list and leaves directions alone."""
+        indicator, _, _ = indicator_with_mocks
+        indicator._bar_heights = [10, 12, 8, 14]
+        indicator._bar_directions = [1, -1, -1, 1]
+        heights = indicator._bar_heights
+
+        indicator._stop_bar_animation()
+
+        assert indicator._bar_heights is heights
+        assert heights == [indicator.BAR_MIN_HEIGHT] * indicator.BAR_COUNT
+        assert indicator._bar_directions == [1, -1, -1, 1]
+
+    def test_stop_bar_animation_keeps_heights_already_at_min(self, indicator_with_mocks):
+        """Verify stopping again does not rebuild bar heights already at minimum."""
+        indicator, _, _ = indicator_with_mocks
+        indicator._bar_heights = [indicator.BAR_MIN_HEIGHT] * indicator.BAR_COUNT
+        heights = indicator._bar_heights
+
+        indicator._stop_bar_animation()
+
+        assert indicator._bar_heights is heights
 
 
 # =============================================================================
@@ -337,9 +547,9 @@ class TestStopBarAnimation:
 class TestRecordingStateIntegration:
     """Tests for recording state using animated bars."""
 
-    def test_recording_state_draws_bars_not_text(self):
+    def test_recording_state_draws_bars_not_text(self, indicator_with_mocks):
         """Verify recording state draws bars instead of 'REC' text."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.reset_mock()
 
         indicator.set_state("recording")
@@ -349,9 +559,9 @@ class TestRecordingStateIntegration:
         # create_text should not be called for recording state
         mock_canvas.create_text.assert_not_called()
 
-    def test_recording_state_starts_animation(self):
+    def test_recording_state_starts_animation(self, indicator_with_mocks):
         """Verify setting recording state starts bar animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         mock_window.after.reset_mock()
 
         indicator.set_state("recording")
@@ -359,9 +569,9 @@ class TestRecordingStateIntegration:
         # Should schedule animation
         assert mock_window.after.called
 
-    def test_leaving_recording_state_stops_animation(self):
+    def test_leaving_recording_state_stops_animation(self, indicator_with_mocks):
         """Verify leaving recording state stops bar animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
 
         # Enter recording
         indicator.set_state("recording")
@@ -373,17 +583,17 @@ class TestRecordingStateIntegration:
         # Animation should be stopped
         mock_window.after_cancel.assert_called_with("test_id")
 
-    def test_transcribing_state_uses_text_not_bars(self):
+    def test_transcribing_state_uses_text_not_bars(self, indicator_with_mocks):
         """Verify transcribing state uses text ('...') not bars."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
 
         indicator.set_state("transcribing")
 
         mock_canvas.create_text.assert_called()
 
-    def test_success_state_uses_text_not_bars(self):
+    def test_success_state_uses_text_not_bars(self, indicator_with_mocks):
         """Verify success state uses text ('OK') not bars."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
 
         indicator.set_state("success")
 
@@ -397,9 +607,9 @@ class TestRecordingStateIntegration:
 class TestCancelAnimationsIntegration:
     """Tests for _cancel_animations including bar animation."""
 
-    def test_cancel_animations_stops_bar_animation(self):
+    def test_cancel_animations_stops_bar_animation(self, indicator_with_mocks):
         """Verify _cancel_animations also stops bar animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._bar_animation_id = "test_bar_id"
 
         indicator._cancel_animations()
@@ -407,9 +617,9 @@ class TestCancelAnimationsIntegration:
         mock_window.after_cancel.assert_called_with("test_bar_id")
         assert indicator._bar_animation_id is None
 
-    def test_cancel_animations_clears_both_types(self):
+    def test_cancel_animations_clears_both_types(self, indicator_with_mocks):
         """Verify _cancel_animations clears both flash and bar animations."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
         indicator._flash_after_ids = ["flash1", "flash2"]
         indicator._bar_animation_id = "bar_id"
 
@@ -420,122 +630,83 @@ class TestCancelAnimationsIntegration:
 
 
 # =============================================================================
-# PROPERTY-BASED TESTS
+# VISUAL SPEC COMPLIANCE TESTS
 # =============================================================================
 
-class TestBarAnimationProperties:
-    """Property-based tests for bar animation behavior."""
-
-    @given(heights=st.lists(
-        st.integers(min_value=1, max_value=20),
-        min_size=4,
-        max_size=4
-    ))
-    @settings(max_examples=20)
-    def test_bar_heights_always_clamped(self, heights):
-        """Property: Bar heights are always clamped to min/max after animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
-        indicator._current_state = "recording"
-        indicator._bar_heights = list(heights)
-
-        # Run multiple animation steps
-        for _ in range(5):
-            indicator._animate_bars()
-            for h in indicator._bar_heights:
-                assert indicator.BAR_MIN_HEIGHT <= h <= indicator.BAR_MAX_HEIGHT
-
-    @given(state_before=st.sampled_from(["idle", "transcribing", "success", "error"]))
-    @settings(max_examples=15)
-    def test_entering_recording_always_starts_animation(self, state_before):
-        """Property: Entering recording state always starts animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
-
-        # Set to some state first
-        indicator.set_state(state_before)
-        mock_window.after.reset_mock()
-
-        # Enter recording
-        indicator.set_state("recording")
-
-        # Animation should be scheduled
-        assert mock_window.after.called
-
-    @given(state_after=st.sampled_from(["idle", "transcribing", "success", "error"]))
-    @settings(max_examples=15)
-    def test_leaving_recording_always_stops_animation(self, state_after):
-        """Property: Leaving recording state always stops animation."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+class TestVisualSpecCompliance:
+    """Tests verifying visual specification compliance."""
 
-        # Enter recording first
-        indicator.set_state("recording")
-        indicator._bar_animation_id = "test_id"
+    def test_bars_centered_horizontally(self, indicator_with_mocks):
+        """Verify bars are centered horizontally in the indicator."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        mock_canvas.create_rectangle.reset_mock()
 
-        # Leave recording
-        indicator.set_state(state_after)
+        indicator._draw_recording_bars()
 
-        # Animation should be stopped
-        assert indicator._bar_animation_id is None
+        total_bar_width = (4 * 6) + (3 * 3)  # 4 bars, 3 gaps = 33px
+        start_x = (60 - total_bar_width) // 2  # = 13
+        # Bars at min height (4px) around center_y 12
+        expected_calls = [
+            call(start_x + i * 9, 10, start_x + i * 9 + 6, 14,
+                 fill=RecordingIndicator.BAR_COLORS[i], outline="")
+            for i in range(4)
+        ]
+        mock_canvas.create_rectangle.assert_has_calls(expected_calls)
+
+    def test_bars_centered_vertically(self, indicator_with_mocks):
+        """Verify bars are centered vertically in the indicator."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        indicator._bar_heights = [4, 8, 12, 16]
+        mock_canvas.create_rectangle.reset_mock()
 
-    @given(num_cycles=st.integers(min_value=1, max_value=10))
-    @settings(max_examples=10)
-    def test_rapid_recording_state_cycles_safe(self, num_cycles):
-        """Property: Rapid recording state cycles don't leak animations."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator._draw_recording_bars()
 
-        for _ in range(num_cycles):
-            indicator.set_state("recording")
-            indicator.set_state("transcribing")
-            indicator.set_state("success")
+        # Each bar spans center_y (12) +/- half its height
+        expected_calls = [
+            call(x1, 12 - h // 2, x2, 12 + h // 2,
+                 fill=RecordingIndicator.BAR_COLORS[i], outline="")
+            for i, ((x1, x2), h) in enumerate(zip(indicator._bar_x_pairs, [4, 8, 12, 16]))
+        ]
+        mock_canvas.create_rectangle.assert_has_calls(expected_calls)
 
-        # Should end in success state with no lingering bar animation
-        assert indicator._current_state == "success"
-        assert indicator._bar_animation_id is None
+    def test_bar_x_pairs_precomputed(self, indicator_with_mocks):
+        """Verify each bar's horizontal span is laid out once, 6px wide with 3px gaps."""
+        indicator, _, _ = indicator_with_mocks
 
+        assert indicator._bar_x_pairs == ((13, 19), (22, 28), (31, 37), (40, 46))
+        assert indicator._bar_center_y == 12
 
-# =============================================================================
-# VISUAL SPEC COMPLIANCE TESTS
-# =============================================================================
+    def test_canvas_configure_is_bound(self):
+        """Verify the canvas <Configure> event is bound to the layout handler."""
+        indicator, _, mock_canvas = create_indicator_with_mocks()
 
-class TestVisualSpecCompliance:
-    """Tests verifying visual specification compliance."""
+        mock_canvas.bind.assert_called_with("<Configure>", indicator._on_canvas_configure)
 
-    def test_bars_centered_horizontally(self):
-        """Verify bars are centered horizontally in the indicator."""
-        indicator, _, mock_canvas = create_indicator_with_mocks(width=60)
-        mock_canvas.create_rectangle.reset_mock()
+    def test_canvas_resize_recenters_bars(self, indicator_with_mocks):
+        """Verify a <Configure> event lays the bars out for the new size."""
+        indicator, _, mock_canvas = indicator_with_mocks
 
+        indicator._on_canvas_configure(SimpleNamespace(width=100, height=40))
         indicator._draw_recording_bars()
 
-        # Calculate expected bar positions
-        total_bar_width = (4 * 6) + (3 * 3)  # 4 bars, 3 gaps = 33px
-        expected_start_x = (60 - total_bar_width) // 2  # = 13
-
-        # Get bar rectangle calls (skip background at index 0)
-        calls = mock_canvas.create_rectangle.call_args_list[1:]
-        for i, call_obj in enumerate(calls):
-            expected_x = expected_start_x + i * (6 + 3)
-            actual_x = call_obj[0][0]
-            assert actual_x == expected_x, f"Bar {i} x position mismatch"
-
-    def test_bars_centered_vertically(self):
-        """Verify bars are centered vertically in the indicator."""
-        indicator, _, mock_canvas = create_indicator_with_mocks(height=24)
+        total_bar_width = (4 * 6) + (3 * 3)
+        first_bar = mock_canvas.create_rectangle.call_args_list[1][0]
+        assert first_bar[0] == (100 - total_bar_width) // 2
+        assert (first_bar[1] + first_bar[3]) / 2 == 20
 
+    def test_canvas_configure_same_size_keeps_items(self, indicator_with_mocks):
+        """Verify a <Configure> event without a size change keeps the cached items."""
+        indicator, _, mock_canvas = indicator_with_mocks
+        mock_canvas.create_rectangle.side_effect = range(100, 105)
         indicator._draw_recording_bars()
 
-        # Get bar rectangle calls (skip background)
-        calls = mock_canvas.create_rectangle.call_args_list[1:]
+        indicator._on_canvas_configure(SimpleNamespace(width=60, height=24))
 
-        center_y = 24 // 2  # = 12
-        for call_obj in calls:
-            y1 = call_obj[0][1]
-            y2 = call_obj[0][3]
-            bar_center = (y1 + y2) / 2
-            assert abs(bar_center - center_y) <= 1, "Bar not vertically centered"
+        assert indicator._bar_item_ids == [101, 102, 103, 104]
 
-    def test_recording_state_opacity_is_95_percent(self):
+    def test_recording_state_opacity_is_95_percent(self, indicator_with_mocks):
         """Verify recording state uses 0.95 opacity."""
-        indicator, mock_window, _ = create_indicator_with_mocks()
+        indicator, mock_window, _ = indicator_with_mocks
 
         indicator.set_state("recording")
 
@@ -544,9 +715,9 @@ class TestVisualSpecCompliance:
         alpha_calls = [c for c in calls if c[0][0] == "-alpha"]
         assert any(c[0][1] == 0.95 for c in alpha_calls), "Recording opacity should be 0.95"
 
-    def test_bar_background_uses_dark_slate_color(self):
+    def test_bar_background_uses_dark_slate_color(self, indicator_with_mocks):
         """Verify bar background uses #1C1C1E."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
+        indicator, _, mock_canvas = indicator_with_mocks
         mock_canvas.create_rectangle.reset_mock()
 
         indicator._draw_recording_bars()
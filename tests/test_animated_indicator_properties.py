@@ -0,0 +1,96 @@
+"""
+Property-based tests for the Animated Recording Indicator.
+
+Kept apart from test_animated_indicator.py so that a missing hypothesis
+install skips only these tests.
+"""
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+given = hypothesis.given
+settings = hypothesis.settings
+st = hypothesis.strategies
+Phase = hypothesis.Phase
+
+from ._helpers import create_indicator_with_mocks, reset_indicator
+
+
+@pytest.fixture(scope="module")
+def shared_indicator():
+    """One default RecordingIndicator for the module: (indicator, mock_window, mock_canvas)."""
+    return create_indicator_with_mocks()
+
+
+# The animation is deterministic once the inputs are drawn, so a handful of
+# examples covers it and shrinking would only repeat the same mock churn.
+PROPERTY_SETTINGS = settings(max_examples=5, phases=[Phase.generate], deadline=None)
+
+
+class TestBarAnimationProperties:
+    """Property-based tests for bar animation behavior."""
+
+    @given(heights=st.lists(
+        st.integers(min_value=1, max_value=20),
+        min_size=4,
+        max_size=4
+    ))
+    @PROPERTY_SETTINGS
+    def test_bar_heights_always_clamped(self, shared_indicator, heights):
+        """Property: Bar heights are always clamped to min/max after animation."""
+        indicator, mock_window, _ = reset_indicator(shared_indicator)
+        indicator._current_state = "recording"
+        indicator._bar_heights = list(heights)
+
+        # Run a couple of animation steps
+        for _ in range(2):
+            indicator._animate_bars()
+            for h in indicator._bar_heights:
+                assert indicator.BAR_MIN_HEIGHT <= h <= indicator.BAR_MAX_HEIGHT
+
+    @given(state_before=st.sampled_from(["idle", "transcribing", "success", "error"]))
+    @PROPERTY_SETTINGS
+    def test_entering_recording_always_starts_animation(self, shared_indicator, state_before):
+        """Property: Entering recording state always starts animation."""
+        indicator, mock_window, _ = reset_indicator(shared_indicator)
+
+        # Set to some state first
+        indicator.set_state(state_before)
+        mock_window.after.reset_mock()
+
+        # Enter recording
+        indicator.set_state("recording")
+
+        # Animation should be scheduled
+        assert mock_window.after.called
+
+    @given(state_after=st.sampled_from(["idle", "transcribing", "success", "error"]))
+    @PROPERTY_SETTINGS
+    def test_leaving_recording_always_stops_animation(self, shared_indicator, state_after):
+        """Property: Leaving recording state always stops animation."""
+        indicator, mock_window, _ = reset_indicator(shared_indicator)
+
+        # Enter recording first
+        indicator.set_state("recording")
+        indicator._bar_animation_id = "test_id"
+
+        # Leave recording
+        indicator.set_state(state_after)
+
+        # Animation should be stopped
+        assert indicator._bar_animation_id is None
+
+    @given(num_cycles=st.integers(min_value=1, max_value=10))
+    @PROPERTY_SETTINGS
+    def test_rapid_recording_state_cycles_safe(self, shared_indicator, num_cycles):
+        """Property: Rapid recording state cycles don't leak animations."""
+        indicator, mock_window, _ = reset_indicator(shared_indicator)
+
+        for _ in range(num_cycles):
+            indicator.set_state("recording")
+            indicator.set_state("transcribing")
+            indicator.set_state("success")
+
+        # Should end in success state with no lingering bar animation
+        assert indicator._current_state == "success"
+        assert indicator._bar_animation_id is None
@@ -14,19 +14,22 @@ import pytest
 from hypothesis import given, settings, strategies as st, HealthCheck
 from unittest.mock import MagicMock, patch
 
+from context_aware_whisper.ui.indicator import RecordingIndicator
+
+from ._helpers import CANVAS_SPEC, TOPLEVEL_SPEC, configure_mock_window, reset_indicator
+
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
 def create_mock_tkinter():
-    """Create comprehensive tkinter mocks for indicator testing."""
-    mock_window = MagicMock()
-    mock_window.winfo_screenwidth.return_value = 1920
-    mock_window.winfo_screenheight.return_value = 1080
-    mock_window.winfo_vrootx.return_value = 0
-    mock_window.winfo_vrooty.return_value = 0
-    mock_canvas = MagicMock()
+    """Create comprehensive tkinter mocks for indicator testing, specced like Toplevel/Canvas."""
+    mock_window = MagicMock(spec=TOPLEVEL_SPEC)
+    configure_mock_window(mock_window)
+    mock_window.after.return_value = "after#1"
+    mock_canvas = MagicMock(spec=CANVAS_SPEC)
+    mock_canvas._w = ".!canvas"
     return mock_window, mock_canvas
 
 
@@ -36,11 +39,21 @@ def create_indicator_with_mocks(position="top-center", width=60, height=24):
 
     with patch('context_aware_whisper.ui.indicator.tk.Toplevel', return_value=mock_window), \
          patch('context_aware_whisper.ui.indicator.tk.Canvas', return_value=mock_canvas):
-        from context_aware_whisper.ui.indicator import RecordingIndicator
         indicator = RecordingIndicator(width=width, height=height, position=position)
         return indicator, mock_window, mock_canvas
 
 
+@pytest.fixture(scope="module")
+def property_indicator():
+    """
+    One RecordingIndicator shared by the property tests in this module.
+
+    Returns (indicator, mock_window, mock_canvas). Each example starts from
+    reset_indicator() instead of rebuilding the indicator and its mocks.
+    """
+    return create_indicator_with_mocks()
+
+
 # =============================================================================
 # BAR ANIMATION CONSTANTS TESTS
 # =============================================================================
@@ -50,65 +63,47 @@ class TestBarAnimationConstants:
 
     def test_bar_count_constant_exists(self):
         """Test that BAR_COUNT constant exists and is 4."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_COUNT')
         assert RecordingIndicator.BAR_COUNT == 4
 
     def test_bar_width_constant_exists(self):
         """Test that BAR_WIDTH constant exists and is 6."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_WIDTH')
         assert RecordingIndicator.BAR_WIDTH == 6
 
     def test_bar_gap_constant_exists(self):
         """Test that BAR_GAP constant exists and is 3."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_GAP')
         assert RecordingIndicator.BAR_GAP == 3
 
     def test_bar_min_height_constant_exists(self):
         """Test that BAR_MIN_HEIGHT constant exists and is 4."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_MIN_HEIGHT')
         assert RecordingIndicator.BAR_MIN_HEIGHT == 4
 
     def test_bar_max_height_constant_exists(self):
         """Test that BAR_MAX_HEIGHT constant exists and is 16."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_MAX_HEIGHT')
         assert RecordingIndicator.BAR_MAX_HEIGHT == 16
 
     def test_bar_animation_interval_constant_exists(self):
         """Test that BAR_ANIMATION_INTERVAL_MS constant exists and is 80 (~12.5 FPS)."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_ANIMATION_INTERVAL_MS')
         assert RecordingIndicator.BAR_ANIMATION_INTERVAL_MS == 80
 
     def test_bar_colors_constant_exists(self):
         """Test that BAR_COLORS constant exists with correct gradient."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_COLORS')
         assert len(RecordingIndicator.BAR_COLORS) == 4
-        assert RecordingIndicator.BAR_COLORS == ["#FF3B30", "#FF6B5B", "#FF9500", "#FF6B5B"]
+        assert RecordingIndicator.BAR_COLORS == ("#FF3B30", "#FF6B5B", "#FF9500", "#FF6B5B")
 
     def test_bar_bg_color_constant_exists(self):
         """Test that BAR_BG_COLOR constant exists (dark slate)."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, 'BAR_BG_COLOR')
         assert RecordingIndicator.BAR_BG_COLOR == "#1C1C1E"
 
     def test_bar_dimensions_fit_within_default_indicator(self):
         """Test that bars fit within the default 60x24 indicator."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         total_bar_width = (RecordingIndicator.BAR_COUNT * RecordingIndicator.BAR_WIDTH) + \
                           ((RecordingIndicator.BAR_COUNT - 1) * RecordingIndicator.BAR_GAP)
 
@@ -134,8 +129,6 @@ class TestBarAnimationInstanceVariables:
 
     def test_bar_heights_initialized(self):
         """Test that _bar_heights is initialized with correct values."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, _, _ = create_indicator_with_mocks()
         assert hasattr(indicator, '_bar_heights')
         assert isinstance(indicator._bar_heights, list)
@@ -155,76 +148,6 @@ class TestBarAnimationInstanceVariables:
         assert indicator._bar_directions == [1, -1, 1, -1]
 
 
-# =============================================================================
-# BAR DRAWING METHOD TESTS
-# =============================================================================
-
-class TestDrawRecordingBars:
-    """Tests for _draw_recording_bars method."""
-
-    def test_draw_recording_bars_method_exists(self):
-        """Test that _draw_recording_bars method exists."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        assert hasattr(RecordingIndicator, '_draw_recording_bars')
-        assert callable(getattr(RecordingIndicator, '_draw_recording_bars'))
-
-    def test_draw_recording_bars_clears_canvas(self):
-        """Test that _draw_recording_bars clears the canvas first."""
-        indicator, _, mock_canvas = create_indicator_with_mocks()
-
-        mock_canvas.delete.reset_mock()
-        indicator._draw_recording_bars()
-
-        mock_canvas.delete.assert_called_with("all")
-
-    def test_draw_recording_bars_draws_background(self):
-        """Test that _draw_recording_bars draws dark background."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        indicator, _, mock_canvas = create_indicator_with_mocks()
-
-        mock_canvas.create_rectangle.reset_mock()
-        indicator._draw_recording_bars()
-
-        # First rectangle should be the background
-        calls = mock_canvas.create_rectangle.call_args_list
-        assert len(calls) >= 1
-
-        # Check first call is background
-        first_call_kwargs = calls[0][1]
-        assert first_call_kwargs.get('fill') == RecordingIndicator.BAR_BG_COLOR
-
-    def test_draw_recording_bars_draws_four_bars(self):
-        """Test that _draw_recording_bars draws 4 bars."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        indicator, _, mock_canvas = create_indicator_with_mocks()
-
-        mock_canvas.create_rectangle.reset_mock()
-        indicator._draw_recording_bars()
-
-        # Should have 5 rectangles: 1 background + 4 bars
-        calls = mock_canvas.create_rectangle.call_args_list
-        assert len(calls) == 5
-
-    def test_draw_recording_bars_uses_bar_colors(self):
-        """Test that _draw_recording_bars uses correct bar colors."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        indicator, _, mock_canvas = create_indicator_with_mocks()
-
-        mock_canvas.create_rectangle.reset_mock()
-        indicator._draw_recording_bars()
-
-        calls = mock_canvas.create_rectangle.call_args_list
-        # Skip background (first call), check bar colors
-        for i in range(1, 5):
-            fill_color = calls[i][1].get('fill')
-            expected_color = RecordingIndicator.BAR_COLORS[(i-1) % len(RecordingIndicator.BAR_COLORS)]
-            assert fill_color == expected_color, f"Bar {i} has wrong color: {fill_color} vs {expected_color}"
-
-
 # =============================================================================
 # BAR ANIMATION METHOD TESTS
 # =============================================================================
@@ -234,8 +157,6 @@ class TestAnimateBars:
 
     def test_animate_bars_method_exists(self):
         """Test that _animate_bars method exists."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, '_animate_bars')
         assert callable(getattr(RecordingIndicator, '_animate_bars'))
 
@@ -254,26 +175,20 @@ class TestAnimateBars:
 
     def test_animate_bars_updates_bar_heights(self):
         """Test that _animate_bars updates bar heights."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, mock_window, _ = create_indicator_with_mocks()
         indicator._current_state = "recording"
 
-        initial_heights = indicator._bar_heights.copy()
-
-        # Mock random to return consistent values for testing
-        with patch('context_aware_whisper.ui.indicator.random.randint', return_value=3):
+        # Use a constant step so the update is predictable
+        with patch('context_aware_whisper.ui.indicator.BAR_STEPS', (3,)):
             indicator._animate_bars()
 
-        # At least some heights should have changed
-        # (Some may bounce at limits, so we check that animation occurred)
-        assert indicator._bar_heights != initial_heights or \
-               mock_window.after.called  # Animation was scheduled
+        # Bars start at MIN_HEIGHT (4) heading up, down, up, down: the up
+        # bars grow by one step and the down bars bounce off the floor
+        assert indicator._bar_heights == [7, 4, 7, 4]
+        assert mock_window.after.called  # Animation was scheduled
 
     def test_animate_bars_respects_height_bounds(self):
         """Test that _animate_bars keeps heights within bounds."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, _, _ = create_indicator_with_mocks()
         indicator._current_state = "recording"
 
@@ -281,7 +196,7 @@ class TestAnimateBars:
         indicator._bar_heights = [RecordingIndicator.BAR_MAX_HEIGHT] * 4
         indicator._bar_directions = [1, 1, 1, 1]  # All going up
 
-        with patch('context_aware_whisper.ui.indicator.random.randint', return_value=5):
+        with patch('context_aware_whisper.ui.indicator.BAR_STEPS', (5,)):
             indicator._animate_bars()
 
         # Heights should still be within bounds
@@ -290,8 +205,6 @@ class TestAnimateBars:
 
     def test_animate_bars_reverses_direction_at_limits(self):
         """Test that _animate_bars reverses direction at height limits."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, _, _ = create_indicator_with_mocks()
         indicator._current_state = "recording"
 
@@ -299,7 +212,7 @@ class TestAnimateBars:
         indicator._bar_heights = [RecordingIndicator.BAR_MAX_HEIGHT, 8, 8, 8]
         indicator._bar_directions = [1, 1, 1, 1]
 
-        with patch('context_aware_whisper.ui.indicator.random.randint', return_value=3):
+        with patch('context_aware_whisper.ui.indicator.BAR_STEPS', (3,)):
             indicator._animate_bars()
 
         # First bar should have reversed direction
@@ -307,8 +220,6 @@ class TestAnimateBars:
 
     def test_animate_bars_schedules_next_frame(self):
         """Test that _animate_bars schedules next animation frame."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, mock_window, _ = create_indicator_with_mocks()
         indicator._current_state = "recording"
 
@@ -330,8 +241,6 @@ class TestStopBarAnimation:
 
     def test_stop_bar_animation_method_exists(self):
         """Test that _stop_bar_animation method exists."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert hasattr(RecordingIndicator, '_stop_bar_animation')
         assert callable(getattr(RecordingIndicator, '_stop_bar_animation'))
 
@@ -357,8 +266,6 @@ class TestStopBarAnimation:
 
     def test_stop_bar_animation_resets_bar_heights(self):
         """Test that _stop_bar_animation resets bar heights to minimum."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, _, _ = create_indicator_with_mocks()
 
         # Set heights to random values
@@ -496,11 +403,9 @@ class TestBarAnimationProperties:
 
     @given(height=st.integers(min_value=1, max_value=20))
     @settings(max_examples=20)
-    def test_bar_heights_stay_within_bounds(self, height):
+    def test_bar_heights_stay_within_bounds(self, property_indicator, height):
         """Property: Bar heights always stay within MIN and MAX bounds."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        indicator, _, _ = create_indicator_with_mocks()
+        indicator, _, _ = reset_indicator(property_indicator)
         indicator._current_state = "recording"
 
         # Set initial heights
@@ -515,11 +420,9 @@ class TestBarAnimationProperties:
 
     @given(direction=st.sampled_from([-1, 1]))
     @settings(max_examples=10)
-    def test_bar_direction_reverses_at_limits(self, direction):
+    def test_bar_direction_reverses_at_limits(self, property_indicator, direction):
         """Property: Bar direction always reverses when hitting limits."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
-        indicator, _, _ = create_indicator_with_mocks()
+        indicator, _, _ = reset_indicator(property_indicator)
         indicator._current_state = "recording"
 
         # Set up to trigger limit
@@ -530,7 +433,7 @@ class TestBarAnimationProperties:
 
         indicator._bar_directions = [direction] * 4
 
-        with patch('context_aware_whisper.ui.indicator.random.randint', return_value=3):
+        with patch('context_aware_whisper.ui.indicator.BAR_STEPS', (3,)):
             indicator._animate_bars()
 
         # Direction should be reversed
@@ -540,9 +443,9 @@ class TestBarAnimationProperties:
     @given(states=st.lists(st.sampled_from(["idle", "recording", "transcribing", "success", "error"]),
                            min_size=1, max_size=20))
     @settings(max_examples=15, suppress_health_check=[HealthCheck.function_scoped_fixture])
-    def test_rapid_state_changes_handle_animation_correctly(self, states):
+    def test_rapid_state_changes_handle_animation_correctly(self, property_indicator, states):
         """Property: Rapid state changes properly manage bar animation."""
-        indicator, _, _ = create_indicator_with_mocks()
+        indicator, _, _ = reset_indicator(property_indicator)
 
         for state in states:
             indicator.set_state(state)
@@ -567,8 +470,6 @@ class TestBarDrawingProperties:
     @settings(max_examples=20)
     def test_bars_centered_regardless_of_dimensions(self, width, height):
         """Property: Bars are always centered horizontally in the indicator."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         indicator, _, mock_canvas = create_indicator_with_mocks(width=width, height=height)
 
         mock_canvas.create_rectangle.reset_mock()
@@ -592,8 +493,6 @@ class TestAnimationTimingProperties:
 
     def test_animation_frame_rate_is_reasonable(self):
         """Property: Animation frame rate is between 10-20 FPS."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         interval_ms = RecordingIndicator.BAR_ANIMATION_INTERVAL_MS
         fps = 1000 / interval_ms
 
@@ -601,8 +500,6 @@ class TestAnimationTimingProperties:
 
     def test_bar_count_matches_colors(self):
         """Property: Number of bar colors matches bar count."""
-        from context_aware_whisper.ui.indicator import RecordingIndicator
-
         assert len(RecordingIndicator.BAR_COLORS) >= RecordingIndicator.BAR_COUNT
 
 
@@ -15,6 +15,24 @@ from scipy.io import wavfile
 from context_aware_whisper.audio_recorder import AudioRecorder
 
 
+def _feed(recorder, chunk):
+    """Deliver a chunk to the recorder the way the input stream callback does."""
+    recorder._audio_callback(chunk, chunk.shape[0], None, None)
+
+
+def _recorded(recorder):
+    """Frames recorded so far, gathered from the buffer segments."""
+    return np.concatenate(recorder._segments)[:recorder._write_pos]
+
+
+def _wait_for_segments(recorder, count, timeout=2.0):
+    """Wait until the grower thread has appended segments up to count."""
+    deadline = time.monotonic() + timeout
+    while len(recorder._segments) < count:
+        assert time.monotonic() < deadline, "grower thread did not add a segment"
+        time.sleep(0.001)
+
+
 class TestAudioRecorderInitialization:
     """Test AudioRecorder initialization."""
 
@@ -23,7 +41,7 @@ class TestAudioRecorderInitialization:
         recorder = AudioRecorder()
         assert recorder.sample_rate == 16000
         assert recorder.channels == 1
-        assert len(recorder.buffer) == 0
+        assert recorder.get_duration() == 0.0
         assert recorder.stream is None
         assert not recorder.is_recording
 
@@ -32,7 +50,7 @@ class TestAudioRecorderInitialization:
         recorder = AudioRecorder(sample_rate=48000, channels=2)
         assert recorder.sample_rate == 48000
         assert recorder.channels == 2
-        assert len(recorder.buffer) == 0
+        assert recorder.get_duration() == 0.0
         assert not recorder.is_recording
 
     def test_init_various_sample_rates(self):
@@ -50,12 +68,12 @@ class TestAudioRecorderBufferOperations:
         """Test clearing the audio buffer."""
         recorder = AudioRecorder()
         # Add some mock data to buffer
-        recorder.buffer.append(np.array([1, 2, 3]))
-        recorder.buffer.append(np.array([4, 5, 6]))
-        assert len(recorder.buffer) == 2
+        _feed(recorder, np.array([[1], [2], [3]], dtype='int16'))
+        _feed(recorder, np.array([[4], [5], [6]], dtype='int16'))
+        assert recorder._write_pos == 6
 
         recorder.clear_buffer()
-        assert len(recorder.buffer) == 0
+        assert recorder._write_pos == 0
 
     def test_get_duration_empty_buffer(self):
         """Test duration calculation with empty buffer."""
@@ -68,19 +86,47 @@ class TestAudioRecorderBufferOperations:
         # Add 16000 samples (1 second at 16kHz)
         chunk1 = np.zeros((8000, 1), dtype='int16')
         chunk2 = np.zeros((8000, 1), dtype='int16')
-        recorder.buffer.append(chunk1)
-        recorder.buffer.append(chunk2)
+        _feed(recorder, chunk1)
+        _feed(recorder, chunk2)
 
         duration = recorder.get_duration()
         assert duration == 1.0
 
+    @patch('sounddevice.InputStream')
+    def test_buffer_grows_and_keeps_audio(self, mock_stream_class):
+        """Test the grower thread adds segments and no frames are lost across them."""
+        mock_stream_class.return_value = Mock()
+        recorder = AudioRecorder(sample_rate=100)  # 3000-frame segments
+        recorder.start_recording()
+        chunks = [np.full((1000, 1), i, dtype='int16') for i in range(5)]
+        for i, chunk in enumerate(chunks):
+            _feed(recorder, chunk)
+            if i == 1:  # past the high-water mark of the only segment
+                _wait_for_segments(recorder, 2)
+
+        np.testing.assert_array_equal(_recorded(recorder), np.concatenate(chunks))
+        assert recorder.get_duration() == 50.0
+
+        expected = io.BytesIO()
+        wavfile.write(expected, 100, np.concatenate(chunks))
+        assert recorder.stop_recording() == expected.getvalue()
+
+    def test_audio_callback_never_allocates(self):
+        """Test a full buffer drops frames in the callback instead of growing there."""
+        recorder = AudioRecorder(sample_rate=100)  # no grower running
+        _feed(recorder, np.ones((2500, 1), dtype='int16'))
+        _feed(recorder, np.ones((1000, 1), dtype='int16'))
+
+        assert len(recorder._segments) == 1
+        assert recorder._write_pos == 3000
+
     def test_get_duration_multiple_chunks(self):
         """Test duration calculation with multiple chunks."""
         recorder = AudioRecorder(sample_rate=16000)
         # Add 3 chunks of 5333 samples each (~1 second total)
         for _ in range(3):
             chunk = np.zeros((5333, 1), dtype='int16')
-            recorder.buffer.append(chunk)
+            _feed(recorder, chunk)
 
         duration = recorder.get_duration()
         expected = 15999 / 16000  # 3 * 5333 / 16000
@@ -118,10 +164,10 @@ class TestAudioRecorderRecordingFlow:
         mock_stream_class.return_value = mock_stream
 
         recorder = AudioRecorder()
-        recorder.buffer.append(np.array([1, 2, 3]))
+        _feed(recorder, np.array([[1], [2], [3]], dtype='int16'))
         recorder.start_recording()
 
-        assert len(recorder.buffer) == 0
+        assert recorder._write_pos == 0
 
     @patch('sounddevice.InputStream')
     def test_start_recording_idempotent(self, mock_stream_class):
@@ -171,7 +217,7 @@ class TestAudioRecorderRecordingFlow:
 
         # Simulate audio data being captured
         audio_data = np.random.randint(-32768, 32767, size=(16000, 1), dtype='int16')
-        recorder.buffer.append(audio_data)
+        _feed(recorder, audio_data)
 
         result = recorder.stop_recording()
 
@@ -196,8 +242,8 @@ class TestAudioRecorderRecordingFlow:
         # Call the callback directly
         recorder._audio_callback(sample_data, 3, None, None)
 
-        assert len(recorder.buffer) == 1
-        np.testing.assert_array_equal(recorder.buffer[0], sample_data)
+        assert recorder._write_pos == 3
+        np.testing.assert_array_equal(_recorded(recorder), sample_data)
 
     @patch('sounddevice.InputStream')
     def test_audio_callback_with_status(self, mock_stream_class, capsys):
@@ -226,7 +272,7 @@ class TestAudioRecorderWAVEncoding:
 
         # Add audio data
         audio_data = np.random.randint(-32768, 32767, size=(16000, 1), dtype='int16')
-        recorder.buffer.append(audio_data)
+        _feed(recorder, audio_data)
 
         wav_bytes = recorder.stop_recording()
 
@@ -249,8 +295,8 @@ class TestAudioRecorderWAVEncoding:
         # Add multiple chunks
         chunk1 = np.random.randint(-32768, 32767, size=(8000, 1), dtype='int16')
         chunk2 = np.random.randint(-32768, 32767, size=(8000, 1), dtype='int16')
-        recorder.buffer.append(chunk1)
-        recorder.buffer.append(chunk2)
+        _feed(recorder, chunk1)
+        _feed(recorder, chunk2)
 
         wav_bytes = recorder.stop_recording()
 
@@ -259,6 +305,36 @@ class TestAudioRecorderWAVEncoding:
         with wave.open(wav_io, 'rb') as wav_file:
             assert wav_file.getnframes() == 16000
 
+    @pytest.mark.parametrize("channels", [1, 2])
+    @patch('sounddevice.InputStream')
+    def test_wav_bytes_match_scipy_encoding(self, mock_stream_class, channels):
+        """Test the hand-built WAV is byte-identical to scipy's encoding."""
+        mock_stream_class.return_value = Mock()
+
+        recorder = AudioRecorder(sample_rate=16000, channels=channels)
+        recorder.start_recording()
+        audio_data = np.random.randint(-32768, 32767, size=(4000, channels), dtype='int16')
+        _feed(recorder, audio_data)
+
+        expected = io.BytesIO()
+        wavfile.write(expected, 16000, audio_data)
+        assert recorder.stop_recording() == expected.getvalue()
+
+    @patch('sounddevice.InputStream')
+    def test_wav_header_sizes_follow_each_recording(self, mock_stream_class):
+        """Test the reused header carries the sizes of the latest recording."""
+        mock_stream_class.return_value = Mock()
+
+        recorder = AudioRecorder(sample_rate=16000, channels=1)
+        for n_frames in (16000, 8000):
+            recorder.start_recording()
+            _feed(recorder, np.zeros((n_frames, 1), dtype='int16'))
+            wav_bytes = recorder.stop_recording()
+
+            with wave.open(io.BytesIO(wav_bytes), 'rb') as wav_file:
+                assert wav_file.getnframes() == n_frames
+            assert len(wav_bytes) == 44 + 2 * n_frames
+
 
 class TestAudioRecorderPropertyBasedTests:
     """Property-based tests for AudioRecorder."""
@@ -275,7 +351,7 @@ class TestAudioRecorderPropertyBasedTests:
         # Add exactly 1 second of audio
         num_samples = sample_rate
         audio_data = np.zeros((num_samples, 1), dtype='int16')
-        recorder.buffer.append(audio_data)
+        _feed(recorder, audio_data)
 
         duration = recorder.get_duration()
         assert abs(duration - 1.0) < 0.0001  # Should be very close to 1 second
@@ -296,7 +372,7 @@ class TestAudioRecorderPropertyBasedTests:
         # Add multiple chunks
         for i in range(num_chunks):
             chunk = np.full((chunk_size, 1), i, dtype='int16')
-            recorder.buffer.append(chunk)
+            _feed(recorder, chunk)
 
         wav_bytes = recorder.stop_recording()
 
@@ -386,7 +462,7 @@ class TestAudioRecorderEdgeCases:
         for i in range(3):
             recorder.start_recording()
             audio_data = np.random.randint(-32768, 32767, size=(1000, 1), dtype='int16')
-            recorder.buffer.append(audio_data)
+            _feed(recorder, audio_data)
             wav_bytes = recorder.stop_recording()
 
             assert len(wav_bytes) > 0
@@ -404,7 +480,7 @@ class TestAudioRecorderEdgeCases:
         # Add 60 seconds worth of audio (simulating max duration)
         for _ in range(60):
             chunk = np.random.randint(-32768, 32767, size=(16000, 1), dtype='int16')
-            recorder.buffer.append(chunk)
+            _feed(recorder, chunk)
 
         duration = recorder.get_duration()
         assert 59.5 < duration < 60.5  # Should be ~60 seconds
@@ -1,370 +1,262 @@
 """
 Test suite for Output Handler Module.
 
-Includes unit tests and property-based tests for the OutputHandler class.
+Unit tests for the OutputHandler class and clipboard helpers.
 """
 
+import re
 import subprocess
-import unittest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
 import pytest
 import pyperclip
 
-from context_aware_whisper.output_handler import OutputHandler, get_clipboard_content
+from context_aware_whisper.output_handler import (
+    OutputHandler,
+    _build_keystroke_script,
+    get_clipboard_content,
+)
 from context_aware_whisper.exceptions import OutputError
 
 
-class TestOutputHandlerClipboard(unittest.TestCase):
-    """Tests for clipboard functionality."""
+# Errors raised by the subprocess.run fake, built once for the module
+OSASCRIPT_FAILED = subprocess.CalledProcessError(1, 'osascript', stderr=b"Permission denied")
+OSASCRIPT_TIMEOUT = subprocess.TimeoutExpired('osascript', 10)
+OSASCRIPT_MISSING = FileNotFoundError()
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
-        # Save original clipboard content to restore after tests
-        try:
-            self.original_clipboard = pyperclip.paste()
-        except Exception:
-            self.original_clipboard = ""
+# Matches the Cmd+V keystroke sent by the paste paths
+CMD_V_PATTERN = re.compile(r'keystroke "v" using command down')
 
-    def tearDown(self):
-        """Restore original clipboard content."""
-        try:
-            pyperclip.copy(self.original_clipboard)
-        except Exception:
-            pass
-
-    def test_copy_to_clipboard_basic(self):
-        """Test basic clipboard copy operation."""
-        test_text = "Hello, World!"
-        self.handler.copy_to_clipboard(test_text)
-        result = pyperclip.paste()
-        self.assertEqual(result, test_text)
-
-    def test_copy_to_clipboard_empty_string(self):
-        """Test that empty string is handled without error."""
-        self.handler.copy_to_clipboard("")
-        # Should not raise an error
 
-    def test_copy_to_clipboard_unicode(self):
-        """Test copying unicode characters."""
-        test_text = "Hello"
-        self.handler.copy_to_clipboard(test_text)
-        result = pyperclip.paste()
-        self.assertEqual(result, test_text)
-
-    def test_copy_to_clipboard_special_chars(self):
-        """Test copying special characters."""
-        test_text = 'Hello, "World"! It\'s a test with $pecial chars.'
-        self.handler.copy_to_clipboard(test_text)
-        result = pyperclip.paste()
-        self.assertEqual(result, test_text)
-
-    def test_copy_to_clipboard_newlines(self):
-        """Test copying text with newlines."""
-        test_text = "Line 1\nLine 2\nLine 3"
-        self.handler.copy_to_clipboard(test_text)
-        result = pyperclip.paste()
-        self.assertEqual(result, test_text)
-
-    def test_copy_to_clipboard_long_text(self):
-        """Test copying long text."""
-        test_text = "A" * 10000
-        self.handler.copy_to_clipboard(test_text)
-        result = pyperclip.paste()
-        self.assertEqual(result, test_text)
-
-
-class TestOutputHandlerTypeText(unittest.TestCase):
-    """Tests for type_text functionality using mocks."""
+class _FakeRun:
+    """
+    Lightweight stand-in for subprocess.run.
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
+    Records calls and returns a successful result without any of MagicMock's
+    attribute tracking. Set side_effect to an exception to make it raise.
+    """
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_basic(self, mock_run):
-        """Test basic keystroke typing."""
-        mock_run.return_value = MagicMock(returncode=0)
+    def __init__(self):
+        self.calls = []
+        self.side_effect = None
 
-        self.handler.type_text("Hello")
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return SimpleNamespace(returncode=0)
 
-        mock_run.assert_called_once()
-        call_args = mock_run.call_args
-        self.assertEqual(call_args[0][0][0], 'osascript')
-        self.assertIn('Hello', call_args[0][0][2])
+    @property
+    def script(self):
+        """AppleScript passed to osascript in the most recent call."""
+        return self.calls[-1][0][0][2]
+
+
+@pytest.fixture(autouse=True)
+def fake_run(monkeypatch):
+    """Replace subprocess.run in output_handler with a recording fake."""
+    fake = _FakeRun()
+    monkeypatch.setattr("context_aware_whisper.output_handler.subprocess.run", fake)
+    return fake
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """Shared OutputHandler; it holds no state besides type_delay."""
+    return OutputHandler()
+
+
+@pytest.fixture
+def slow_handler():
+    """OutputHandler with a non-default type_delay."""
+    return OutputHandler(type_delay=0.05)
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_empty_string(self, mock_run):
-        """Test that empty string doesn't call subprocess."""
-        self.handler.type_text("")
-        mock_run.assert_not_called()
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_escapes_quotes(self, mock_run):
-        """Test that quotes are properly escaped."""
-        mock_run.return_value = MagicMock(returncode=0)
+@pytest.fixture(autouse=True)
+def fake_clipboard(request, monkeypatch):
+    """
+    Back pyperclip with an in-memory box.
 
-        self.handler.type_text('Say "hello"')
+    Avoids a pbcopy/pbpaste spawn per assertion and lets the suite run
+    without a clipboard backend. Tests marked integration use the real one.
+    """
+    if request.node.get_closest_marker("integration"):
+        return
+    box = [""]
+    monkeypatch.setattr(pyperclip, "copy", lambda text: box.__setitem__(0, text))
+    monkeypatch.setattr(pyperclip, "paste", lambda: box[0])
 
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        # Check that quotes are escaped with backslash
-        self.assertIn('\\"hello\\"', script)
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_escapes_backslashes(self, mock_run):
-        """Test that backslashes are properly escaped."""
-        mock_run.return_value = MagicMock(returncode=0)
+class TestOutputHandlerClipboard:
+    """Tests for clipboard functionality."""
+
+    @pytest.mark.parametrize("text", [
+        "Hello, World!",
+        'Hello, "World"! It\'s a test with $pecial chars.',
+        "Line 1\nLine 2\nLine 3",
+        "Tab\there",
+        "12345",
+        "!@#$%^&*()",
+        "Mixed 123 !@# Text",
+        "cafe",
+        pytest.param("a" * 100, id="short-repeat"),
+        pytest.param("A" * 10000, id="long-text"),
+    ])
+    def test_copy_to_clipboard_roundtrip(self, handler, text):
+        """Test that copied text reads back unchanged."""
+        handler.copy_to_clipboard(text)
+        assert pyperclip.paste() == text
+
+    def test_copy_to_clipboard_empty_string(self, handler):
+        """Test that empty string is handled without error."""
+        handler.copy_to_clipboard("")
+        # Should not raise an error
+
+
+class TestOutputHandlerTypeText:
+    """Tests for type_text functionality using mocks."""
 
-        self.handler.type_text('path\\to\\file')
+    def test_type_text_basic(self, handler, fake_run):
+        """Test basic keystroke typing."""
+        handler.type_text("Hello")
+
+        assert len(fake_run.calls) == 1
+        args = fake_run.calls[-1][0][0]
+        assert args[0] == 'osascript'
+        assert 'Hello' in args[2]
 
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        # Check that backslashes are escaped
-        self.assertIn('\\\\', script)
+    def test_type_text_empty_string(self, handler, fake_run):
+        """Test that empty string doesn't call subprocess."""
+        handler.type_text("")
+        assert fake_run.calls == []
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_handles_subprocess_error(self, mock_run):
+    def test_type_text_handles_subprocess_error(self, handler, fake_run):
         """Test error handling when subprocess fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(
-            1, 'osascript', stderr=b"Permission denied"
-        )
+        fake_run.side_effect = OSASCRIPT_FAILED
 
-        with self.assertRaises(OutputError) as context:
-            self.handler.type_text("Hello")
+        with pytest.raises(OutputError) as context:
+            handler.type_text("Hello")
 
-        self.assertIn("Failed to type text", str(context.exception))
+        assert "Failed to type text" in str(context.value)
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_handles_timeout(self, mock_run):
+    def test_type_text_handles_timeout(self, handler, fake_run):
         """Test error handling on timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired('osascript', 10)
+        fake_run.side_effect = OSASCRIPT_TIMEOUT
 
-        with self.assertRaises(OutputError) as context:
-            self.handler.type_text("Hello")
+        with pytest.raises(OutputError) as context:
+            handler.type_text("Hello")
 
-        self.assertIn("timed out", str(context.exception))
+        assert "timed out" in str(context.value)
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_handles_missing_osascript(self, mock_run):
+    def test_type_text_handles_missing_osascript(self, handler, fake_run):
         """Test error handling when osascript not found."""
-        mock_run.side_effect = FileNotFoundError()
+        fake_run.side_effect = OSASCRIPT_MISSING
 
-        with self.assertRaises(OutputError) as context:
-            self.handler.type_text("Hello")
+        with pytest.raises(OutputError) as context:
+            handler.type_text("Hello")
 
-        self.assertIn("osascript not found", str(context.exception))
+        assert "osascript not found" in str(context.value)
 
 
-class TestOutputHandlerOutput(unittest.TestCase):
+class TestOutputHandlerOutput:
     """Tests for the combined output method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
-        try:
-            self.original_clipboard = pyperclip.paste()
-        except Exception:
-            self.original_clipboard = ""
-
-    def tearDown(self):
-        """Restore original clipboard content."""
-        try:
-            pyperclip.copy(self.original_clipboard)
-        except Exception:
-            pass
-
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_output_copies_to_clipboard_and_types(self, mock_run):
+    def test_output_copies_to_clipboard_and_types(self, handler, fake_run):
         """Test that output copies to clipboard and types."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.output("Hello, World!")
+        handler.output("Hello, World!")
 
         # Check clipboard
-        self.assertEqual(pyperclip.paste(), "Hello, World!")
+        assert pyperclip.paste() == "Hello, World!"
         # Check subprocess was called for typing
-        mock_run.assert_called_once()
+        assert len(fake_run.calls) == 1
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_output_empty_string(self, mock_run):
+    def test_output_empty_string(self, handler, fake_run):
         """Test that empty string doesn't trigger actions."""
-        self.handler.output("")
-        mock_run.assert_not_called()
+        handler.output("")
+        assert fake_run.calls == []
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_output_use_paste_mode(self, mock_run):
+    def test_output_use_paste_mode(self, handler, fake_run):
         """Test paste mode uses Cmd+V."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.output("Hello", use_paste=True)
+        handler.output("Hello", use_paste=True)
 
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        self.assertIn('keystroke "v"', script)
-        self.assertIn('command down', script)
+        assert CMD_V_PATTERN.search(fake_run.script)
 
 
-class TestOutputHandlerViaPaste(unittest.TestCase):
+class TestOutputHandlerViaPaste:
     """Tests for the paste-based typing method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
-
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_via_paste_empty(self, mock_run):
+    def test_type_text_via_paste_empty(self, handler, fake_run):
         """Test empty string doesn't trigger paste."""
-        self.handler.type_text_via_paste("")
-        mock_run.assert_not_called()
+        handler.type_text_via_paste("")
+        assert fake_run.calls == []
 
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_type_text_via_paste_copies_and_pastes(self, mock_run):
+    def test_type_text_via_paste_copies_and_pastes(self, handler, fake_run):
         """Test that paste method copies to clipboard and pastes."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.type_text_via_paste("Test text")
+        handler.type_text_via_paste("Test text")
 
         # Check that Cmd+V was triggered
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        self.assertIn('keystroke "v"', script)
-        self.assertIn('command down', script)
+        assert CMD_V_PATTERN.search(fake_run.script)
 
 
-class TestGetClipboardContent(unittest.TestCase):
+class TestGetClipboardContent:
     """Tests for the get_clipboard_content helper function."""
 
-    def setUp(self):
-        """Save original clipboard."""
-        try:
-            self.original_clipboard = pyperclip.paste()
-        except Exception:
-            self.original_clipboard = ""
-
-    def tearDown(self):
-        """Restore original clipboard."""
-        try:
-            pyperclip.copy(self.original_clipboard)
-        except Exception:
-            pass
-
     def test_get_clipboard_content_returns_text(self):
         """Test getting clipboard content."""
         test_text = "Test clipboard content"
         pyperclip.copy(test_text)
         result = get_clipboard_content()
-        self.assertEqual(result, test_text)
+        assert result == test_text
+
 
+@pytest.mark.integration
+class TestRealClipboard:
+    """End-to-end check against the system clipboard."""
 
-class TestOutputHandlerInit(unittest.TestCase):
+    def test_clipboard_roundtrip(self, handler):
+        """Test copy and read back through the real clipboard backend."""
+        try:
+            original = pyperclip.paste()
+        except pyperclip.PyperclipException:
+            pytest.skip("No clipboard backend available")
+        try:
+            handler.copy_to_clipboard("Real clipboard roundtrip")
+            assert get_clipboard_content() == "Real clipboard roundtrip"
+        finally:
+            try:
+                pyperclip.copy(original)
+            except Exception:
+                pass
+
+
+class TestOutputHandlerInit:
     """Tests for OutputHandler initialization."""
 
-    def test_default_type_delay(self):
+    def test_default_type_delay(self, handler):
         """Test default type delay is 0."""
-        handler = OutputHandler()
-        self.assertEqual(handler.type_delay, 0.0)
+        assert handler.type_delay == 0.0
 
-    def test_custom_type_delay(self):
+    def test_custom_type_delay(self, slow_handler):
         """Test custom type delay."""
-        handler = OutputHandler(type_delay=0.05)
-        self.assertEqual(handler.type_delay, 0.05)
+        assert slow_handler.type_delay == 0.05
 
 
-class TestOutputHandlerEscaping(unittest.TestCase):
+class TestOutputHandlerEscaping:
     """Tests for proper escaping of special characters."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
-
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_escape_single_quotes(self, mock_run):
-        """Test single quotes in text."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.type_text("It's working")
-
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
+    @pytest.mark.parametrize("text, expected", [
+        # Quotes are escaped with a backslash
+        ('Say "hello"', 'Say \\"hello\\"'),
+        # Backslashes are doubled
+        ('path\\to\\file', 'path\\\\to\\\\file'),
         # Single quotes don't need escaping in double-quoted AppleScript strings
-        self.assertIn("It's working", script)
-
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_escape_mixed_quotes(self, mock_run):
-        """Test mixed quote types."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.type_text('He said "it\'s fine"')
-
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        # Double quotes should be escaped
-        self.assertIn('\\"it\'s fine\\"', script)
-
-    @patch('context_aware_whisper.output_handler.subprocess.run')
-    def test_escape_backslash_and_quote(self, mock_run):
-        """Test backslash followed by quote."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        self.handler.type_text('path\\"file')
-
-        call_args = mock_run.call_args
-        script = call_args[0][0][2]
-        # Should have escaped backslash and escaped quote
-        self.assertIn('\\\\', script)
-
-
-class TestOutputHandlerPropertyBased(unittest.TestCase):
-    """Property-based tests for OutputHandler."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.handler = OutputHandler()
-        try:
-            self.original_clipboard = pyperclip.paste()
-        except Exception:
-            self.original_clipboard = ""
-
-    def tearDown(self):
-        """Restore original clipboard."""
-        try:
-            pyperclip.copy(self.original_clipboard)
-        except Exception:
-            pass
-
-    def test_clipboard_preserves_ascii(self):
-        """Test clipboard preserves various ASCII strings."""
-        test_cases = [
-            "Hello World",
-            "12345",
-            "!@#$%^&*()",
-            "Mixed 123 !@# Text",
-            "a" * 100,
-            "Tab\there",
-        ]
-        for text in test_cases:
-            with self.subTest(text=text[:20]):
-                self.handler.copy_to_clipboard(text)
-                result = pyperclip.paste()
-                self.assertEqual(result, text)
-
-    def test_clipboard_preserves_unicode(self):
-        """Test clipboard preserves unicode strings."""
-        test_cases = [
-            "cafe",
-            "Hello",
-            "Chinese",
-            "Arabic",
-            "Test",
-        ]
-        for text in test_cases:
-            with self.subTest(text=text):
-                self.handler.copy_to_clipboard(text)
-                result = pyperclip.paste()
-                self.assertEqual(result, text)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        ("It's working", "It's working"),
+        # Only the double quotes are escaped in mixed quotes
+        ('He said "it\'s fine"', 'He said \\"it\'s fine\\"'),
+        # Backslash is escaped before the quote, so they don't combine
+        ('path\\"file', 'path\\\\\\"file'),
+    ])
+    def test_keystroke_script_escaping(self, text, expected):
+        """Test that text is escaped for a double-quoted AppleScript string."""
+        script = _build_keystroke_script(text)
+        assert script == f'tell application "System Events" to keystroke "{expected}"'
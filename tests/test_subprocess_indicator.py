@@ -77,6 +77,102 @@ class TestSubprocessIndicatorClientLifecycle:
         assert result is False
         assert indicator._started is False
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX pipes only")
+    def test_start_detects_ready_signal(self):
+        """Test that start returns True as soon as the subprocess prints ready."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        real_popen = subprocess.Popen
+        code = "import sys; print('ready', flush=True); sys.stdin.read()"
+
+        with patch(
+            'context_aware_whisper.ui.subprocess_indicator_client.subprocess.Popen',
+            side_effect=lambda args, **kwargs: real_popen([sys.executable, "-c", code], **kwargs),
+        ):
+            indicator = SubprocessIndicator()
+            try:
+                assert indicator.start() is True
+                assert indicator._started is True
+            finally:
+                indicator._kill_process()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX pipes only")
+    def test_watchdog_detects_subprocess_death(self):
+        """Test that the watchdog marks the indicator dead and schedules a restart."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        real_popen = subprocess.Popen
+        code = "import sys; print('ready', flush=True); sys.stdin.read()"
+
+        with patch(
+            'context_aware_whisper.ui.subprocess_indicator_client.subprocess.Popen',
+            side_effect=lambda args, **kwargs: real_popen([sys.executable, "-c", code], **kwargs),
+        ):
+            indicator = SubprocessIndicator()
+            with patch.object(indicator, '_schedule_restart') as mock_schedule:
+                assert indicator.start() is True
+                assert indicator.is_running is True
+
+                indicator._process.kill()
+                deadline = time.monotonic() + 5.0
+                while indicator.is_running and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                assert indicator.is_running is False
+                assert indicator._started is False
+                assert indicator._restart_needed is True
+                mock_schedule.assert_called_once()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX pipes only")
+    def test_stop_returns_promptly_after_subprocess_death(self):
+        """Test that stop does not wait out STOP_TIMEOUT once the watchdog has reaped the subprocess."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        real_popen = subprocess.Popen
+        code = "import sys; print('ready', flush=True); sys.stdin.read()"
+
+        with patch(
+            'context_aware_whisper.ui.subprocess_indicator_client.subprocess.Popen',
+            side_effect=lambda args, **kwargs: real_popen([sys.executable, "-c", code], **kwargs),
+        ):
+            indicator = SubprocessIndicator()
+            with patch.object(indicator, '_schedule_restart'):
+                assert indicator.start() is True
+
+                indicator._process.kill()
+                deadline = time.monotonic() + 5.0
+                while indicator.is_running and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                assert indicator.is_running is False
+
+                start_time = time.monotonic()
+                indicator.stop()
+                elapsed = time.monotonic() - start_time
+
+        assert indicator._process is None
+        assert elapsed < indicator.STOP_TIMEOUT / 4
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX pipes only")
+    def test_start_detects_premature_exit(self):
+        """Test that start returns False without waiting for READY_TIMEOUT when the subprocess exits."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        real_popen = subprocess.Popen
+        code = "import sys; sys.exit(1)"
+
+        with patch(
+            'context_aware_whisper.ui.subprocess_indicator_client.subprocess.Popen',
+            side_effect=lambda args, **kwargs: real_popen([sys.executable, "-c", code], **kwargs),
+        ):
+            indicator = SubprocessIndicator()
+            start_time = time.monotonic()
+            result = indicator.start()
+            elapsed = time.monotonic() - start_time
+
+        assert result is False
+        assert indicator._process is None
+        assert elapsed < indicator.READY_TIMEOUT
+
     def test_stop_when_not_started(self):
         """Test that stop doesn't crash when not started."""
         from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
@@ -133,6 +229,21 @@ class TestSubprocessIndicatorClientStateManagement:
             # Should not raise exception
             indicator.set_state(state)
 
+    def test_exit_is_not_a_settable_state(self):
+        """Test that set_state cannot be used to send the exit command."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+
+        indicator = SubprocessIndicator()
+        indicator._started = True
+        indicator._process = mock_process
+
+        indicator.set_state("exit")
+
+        mock_process.stdin.write.assert_not_called()
+
     def test_invalid_state_ignored(self):
         """Test that invalid states are silently ignored."""
         from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
@@ -161,7 +272,7 @@ class TestSubprocessIndicatorClientStateManagement:
 
         indicator.set_state("recording")
 
-        mock_process.stdin.write.assert_called_with("recording\n")
+        mock_process.stdin.write.assert_called_with(b"R")
         mock_process.stdin.flush.assert_called()
 
     def test_redundant_state_updates_skipped(self):
@@ -200,7 +311,7 @@ class TestSubprocessIndicatorClientStateManagement:
         indicator.set_state("success")
 
         # Should write to stdin (not skipped for success/error)
-        mock_process.stdin.write.assert_called_with("success\n")
+        mock_process.stdin.write.assert_called_with(b"S")
 
 
 class TestSubprocessIndicatorClientConstants:
@@ -335,6 +446,34 @@ class TestSubprocessIndicatorIPCProtocol:
             for cmd in valid_commands:
                 assert f'"{cmd}"' in code or f"'{cmd}'" in code, f"Command {cmd} should be handled"
 
+    def test_client_and_subprocess_command_codes_match(self):
+        """Test that client state codes match the codes the subprocess dispatches on."""
+        import ast
+        from context_aware_whisper.ui.subprocess_indicator_client import EXIT_CODE, STATE_CODES
+
+        script_path = Path(__file__).parent.parent / "src" / "context_aware_whisper" / "ui" / "subprocess_indicator.py"
+        tree = ast.parse(script_path.read_text())
+        command_codes = None
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and getattr(node.targets[0], "id", None) == "COMMAND_CODES":
+                command_codes = {
+                    key.args[0].value: value.value
+                    for key, value in zip(node.value.keys, node.value.values)
+                }
+
+        assert command_codes is not None
+        client_codes = {code.decode(): state for state, code in STATE_CODES.items()}
+        client_codes[EXIT_CODE.decode()] = "exit"
+        assert client_codes == command_codes
+
+    def test_state_codes_are_single_bytes(self):
+        """Test that every IPC command is a distinct single byte."""
+        from context_aware_whisper.ui.subprocess_indicator_client import EXIT_CODE, STATE_CODES
+
+        codes = list(STATE_CODES.values()) + [EXIT_CODE]
+        assert all(len(code) == 1 for code in codes)
+        assert len(set(codes)) == len(codes)
+
     def test_ready_signal_sent_on_startup(self):
         """Test that subprocess sends 'ready' signal on startup."""
         script_path = Path(__file__).parent.parent / "src" / "context_aware_whisper" / "ui" / "subprocess_indicator.py"
@@ -382,6 +521,118 @@ class TestSubprocessIndicatorErrorHandling:
             indicator.set_state("recording")
             assert indicator._started is False  # Should mark as not started
 
+    def test_failed_restart_opens_backoff_window(self):
+        """Test that a failed restart blocks further attempts until the backoff expires."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        indicator = SubprocessIndicator()
+
+        with patch.object(indicator, 'start', return_value=False) as mock_start:
+            indicator._try_restart()
+            indicator._try_restart()
+
+        assert mock_start.call_count == 1
+        assert indicator._next_restart_allowed > time.monotonic()
+        assert indicator._restart_backoff == SubprocessIndicator.RESTART_BACKOFF_INITIAL * 2
+
+    def test_restart_backoff_is_capped(self):
+        """Test that the restart backoff never exceeds RESTART_BACKOFF_MAX."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        indicator = SubprocessIndicator()
+
+        with patch.object(indicator, 'start', return_value=False):
+            for _ in range(12):
+                indicator._next_restart_allowed = 0.0
+                indicator._try_restart()
+
+        assert indicator._restart_backoff == SubprocessIndicator.RESTART_BACKOFF_MAX
+
+    def test_successful_restart_resets_backoff(self):
+        """Test that a successful restart closes the circuit breaker."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        indicator = SubprocessIndicator()
+        indicator._restart_needed = True
+        indicator._restart_backoff = 8.0
+
+        with patch.object(indicator, 'start', return_value=True):
+            indicator._try_restart()
+
+        assert indicator._restart_needed is False
+        assert indicator._restart_backoff == SubprocessIndicator.RESTART_BACKOFF_INITIAL
+        assert indicator._next_restart_allowed == 0.0
+
+    def test_set_state_does_not_wait_for_restart(self):
+        """Test that set_state returns without waiting for the subprocess to restart."""
+        import threading
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        mock_process = MagicMock()
+        mock_process.stdin.write.side_effect = BrokenPipeError()  # Process exited
+
+        indicator = SubprocessIndicator()
+        indicator._started = True
+        indicator._process = mock_process
+
+        restart_called = threading.Event()
+        release_restart = threading.Event()
+
+        def slow_restart():
+            restart_called.set()
+            release_restart.wait(timeout=5.0)
+
+        with patch.object(indicator, '_try_restart', side_effect=slow_restart):
+            indicator.set_state("recording")
+            assert restart_called.wait(timeout=5.0)
+            release_restart.set()
+
+        assert indicator._started is False
+        assert indicator._restart_needed is True
+
+    def test_schedule_restart_starts_one_thread_per_burst(self):
+        """Test that repeated failures while a restart is pending start a single thread."""
+        import threading
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        indicator = SubprocessIndicator()
+        release_restart = threading.Event()
+
+        with patch.object(indicator, 'start', side_effect=lambda: release_restart.wait(timeout=5.0)) as mock_start, \
+                patch('context_aware_whisper.ui.subprocess_indicator_client.threading.Thread',
+                      wraps=threading.Thread) as mock_thread:
+            for _ in range(20):
+                indicator._schedule_restart()
+            assert indicator._restart_scheduled is True
+
+            release_restart.set()
+            deadline = time.monotonic() + 5.0
+            while indicator._restart_scheduled and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert mock_thread.call_count == 1
+        assert mock_start.call_count == 1
+        assert indicator._restart_scheduled is False
+
+    def test_set_state_write_does_not_hold_lock(self):
+        """Test that the pipe write happens after the lock is released."""
+        from context_aware_whisper.ui.subprocess_indicator_client import SubprocessIndicator
+
+        indicator = SubprocessIndicator()
+        lock_held_during_write = []
+
+        mock_process = MagicMock()
+        mock_process.poll.return_value = None
+        mock_process.stdin.write.side_effect = lambda data: lock_held_during_write.append(indicator._lock.locked())
+
+        indicator._started = True
+        indicator._process = mock_process
+
+        indicator.set_state("recording")
+
+        assert lock_held_during_write == [False]
+        assert indicator.current_state == "recording"
+
 
 class TestSubprocessIndicatorCleanup:
     """Tests for subprocess indicator cleanup."""
@@ -396,11 +647,12 @@ class TestSubprocessIndicatorCleanup:
 
         indicator = SubprocessIndicator()
         indicator._started = True
+        indicator._alive = True
         indicator._process = mock_process
 
         indicator.stop()
 
-        mock_process.stdin.write.assert_called_with("exit\n")
+        mock_process.stdin.write.assert_called_with(b"X")
 
     def test_stop_waits_for_process(self):
         """Test that stop waits for process to terminate."""
@@ -411,6 +663,7 @@ class TestSubprocessIndicatorCleanup:
 
         indicator = SubprocessIndicator()
         indicator._started = True
+        indicator._alive = True
         indicator._process = mock_process
 
         indicator.stop()
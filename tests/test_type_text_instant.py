@@ -11,27 +11,30 @@ This ensures the user's clipboard is not polluted with transcribed text.
 """
 
 import subprocess
-import unittest
 from unittest.mock import MagicMock, patch, call
 
+import pytest
 
-class TestMacOSTypeTextInstant(unittest.TestCase):
-    """Tests for macOS type_text_instant() method."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        from context_aware_whisper.platform.macos.output_handler import MacOSOutputHandler
-        self.handler = MacOSOutputHandler()
+@pytest.fixture
+def macos_handler():
+    """Create a MacOSOutputHandler."""
+    from context_aware_whisper.platform.macos.output_handler import MacOSOutputHandler
+    return MacOSOutputHandler()
+
+
+class TestMacOSTypeTextInstant:
+    """Tests for macOS type_text_instant() method."""
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_saves_and_restores_clipboard(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_saves_and_restores_clipboard(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that clipboard is saved and restored after paste."""
         mock_run.return_value = MagicMock(returncode=0)
         mock_pyperclip.paste.return_value = "original content"
 
-        self.handler.type_text_instant("new text")
+        macos_handler.type_text_instant("new text")
 
         # Should save clipboard first
         mock_pyperclip.paste.assert_called_once()
@@ -40,29 +43,29 @@ class TestMacOSTypeTextInstant(unittest.TestCase):
         # Should restore original clipboard
         mock_pyperclip.copy.assert_any_call("original content")
         # Verify order: paste (save), copy (new), copy (restore)
-        self.assertEqual(mock_pyperclip.copy.call_count, 2)
+        assert mock_pyperclip.copy.call_count == 2
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_sends_cmd_v(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_sends_cmd_v(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that Cmd+V is sent to paste."""
         mock_run.return_value = MagicMock(returncode=0)
         mock_pyperclip.paste.return_value = ""
 
-        self.handler.type_text_instant("test text")
+        macos_handler.type_text_instant("test text")
 
         mock_run.assert_called_once()
         call_args = mock_run.call_args
         script = call_args[0][0][2]
-        self.assertIn('keystroke "v"', script)
-        self.assertIn('command down', script)
+        assert 'keystroke "v"' in script
+        assert 'command down' in script
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
-    def test_instant_paste_empty_string_does_nothing(self, mock_run, mock_pyperclip):
+    def test_instant_paste_empty_string_does_nothing(self, mock_run, mock_pyperclip, macos_handler):
         """Test that empty string doesn't trigger any actions."""
-        self.handler.type_text_instant("")
+        macos_handler.type_text_instant("")
 
         mock_run.assert_not_called()
         mock_pyperclip.copy.assert_not_called()
@@ -70,13 +73,13 @@ class TestMacOSTypeTextInstant(unittest.TestCase):
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_handles_empty_clipboard(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_handles_empty_clipboard(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that empty clipboard is handled gracefully."""
         mock_run.return_value = MagicMock(returncode=0)
         mock_pyperclip.paste.side_effect = Exception("Clipboard empty")
 
         # Should not raise an error
-        self.handler.type_text_instant("new text")
+        macos_handler.type_text_instant("new text")
 
         # Should still copy the new text
         mock_pyperclip.copy.assert_called_with("new text")
@@ -84,14 +87,14 @@ class TestMacOSTypeTextInstant(unittest.TestCase):
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_restores_clipboard_even_on_error(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_restores_clipboard_even_on_error(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that clipboard is restored even if paste fails."""
         mock_pyperclip.paste.return_value = "original content"
         mock_run.side_effect = subprocess.CalledProcessError(1, 'osascript', stderr=b"error")
 
         from context_aware_whisper.exceptions import OutputError
-        with self.assertRaises(OutputError):
-            self.handler.type_text_instant("new text")
+        with pytest.raises(OutputError):
+            macos_handler.type_text_instant("new text")
 
         # Original clipboard should still be restored
         mock_pyperclip.copy.assert_called_with("original content")
@@ -99,42 +102,33 @@ class TestMacOSTypeTextInstant(unittest.TestCase):
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_timeout_raises_error(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_timeout_raises_error(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that timeout raises OutputError."""
         mock_pyperclip.paste.return_value = ""
         mock_run.side_effect = subprocess.TimeoutExpired('osascript', 10)
 
         from context_aware_whisper.exceptions import OutputError
-        with self.assertRaises(OutputError) as context:
-            self.handler.type_text_instant("test")
+        with pytest.raises(OutputError) as context:
+            macos_handler.type_text_instant("test")
 
-        self.assertIn("timed out", str(context.exception))
+        assert "timed out" in str(context.value)
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
     @patch('context_aware_whisper.platform.macos.output_handler.time.sleep')
-    def test_instant_paste_waits_for_completion(self, mock_sleep, mock_run, mock_pyperclip):
+    def test_instant_paste_waits_for_completion(self, mock_sleep, mock_run, mock_pyperclip, macos_handler):
         """Test that sleep is called to wait for paste completion."""
         mock_run.return_value = MagicMock(returncode=0)
         mock_pyperclip.paste.return_value = ""
 
-        self.handler.type_text_instant("test")
+        macos_handler.type_text_instant("test")
 
         mock_sleep.assert_called_once_with(0.05)
 
 
-class TestWindowsTypeTextInstant(unittest.TestCase):
+class TestWindowsTypeTextInstant:
     """Tests for Windows type_text_instant() method."""
 
-    @patch('context_aware_whisper.platform.windows.output_handler.Controller')
-    def setUp(self, mock_controller):
-        """Set up test fixtures."""
-        self.mock_keyboard = MagicMock()
-        mock_controller.return_value = self.mock_keyboard
-
-        from context_aware_whisper.platform.windows.output_handler import WindowsOutputHandler
-        self.handler = WindowsOutputHandler()
-
     @patch('context_aware_whisper.platform.windows.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.windows.output_handler.time.sleep')
     @patch('context_aware_whisper.platform.windows.output_handler.Controller')
@@ -152,9 +146,9 @@ class TestWindowsTypeTextInstant(unittest.TestCase):
         mock_pyperclip.paste.assert_called()
         # Should copy new text and restore original
         copy_calls = mock_pyperclip.copy.call_args_list
-        self.assertEqual(len(copy_calls), 2)
-        self.assertEqual(copy_calls[0][0][0], "new text")
-        self.assertEqual(copy_calls[1][0][0], "original content")
+        assert len(copy_calls) == 2
+        assert copy_calls[0][0][0] == "new text"
+        assert copy_calls[1][0][0] == "original content"
 
     @patch('context_aware_whisper.platform.windows.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.windows.output_handler.time.sleep')
@@ -192,7 +186,7 @@ class TestWindowsTypeTextInstant(unittest.TestCase):
         mock_pyperclip.copy.assert_not_called()
 
 
-class TestLinuxTypeTextInstant(unittest.TestCase):
+class TestLinuxTypeTextInstant:
     """Tests for Linux type_text_instant() method."""
 
     @patch("context_aware_whisper.platform.linux.output_handler.is_tool_available")
@@ -216,9 +210,9 @@ class TestLinuxTypeTextInstant(unittest.TestCase):
 
         # Should copy new text and restore original
         copy_calls = mock_pyperclip.copy.call_args_list
-        self.assertEqual(len(copy_calls), 2)
-        self.assertEqual(copy_calls[0][0][0], "new text")
-        self.assertEqual(copy_calls[1][0][0], "original content")
+        assert len(copy_calls) == 2
+        assert copy_calls[0][0][0] == "new text"
+        assert copy_calls[1][0][0] == "original content"
 
     @patch("context_aware_whisper.platform.linux.output_handler.is_tool_available")
     @patch("context_aware_whisper.platform.linux.output_handler.get_display_server")
@@ -266,7 +260,7 @@ class TestLinuxTypeTextInstant(unittest.TestCase):
         # Should have called wl-copy and wtype
         calls = mock_run.call_args_list
         # wl-paste for getting original, wl-copy for new text, wtype for paste, wl-copy for restore
-        self.assertTrue(any("wtype" in str(c) for c in calls))
+        assert any("wtype" in str(c) for c in calls)
 
     @patch("context_aware_whisper.platform.linux.output_handler.is_tool_available")
     @patch("context_aware_whisper.platform.linux.output_handler.get_display_server")
@@ -311,10 +305,10 @@ class TestLinuxTypeTextInstant(unittest.TestCase):
 
         # Should have called xdotool for paste
         xdotool_calls = [c for c in mock_run.call_args_list if "xdotool" in str(c)]
-        self.assertTrue(len(xdotool_calls) > 0)
+        assert len(xdotool_calls) > 0
 
 
-class TestBaseOutputMethodUsesInstant(unittest.TestCase):
+class TestBaseOutputMethodUsesInstant:
     """Test that the base output() method now uses type_text_instant()."""
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
@@ -331,9 +325,9 @@ class TestBaseOutputMethodUsesInstant(unittest.TestCase):
 
         # Should have saved and restored clipboard (instant paste behavior)
         copy_calls = mock_pyperclip.copy.call_args_list
-        self.assertEqual(len(copy_calls), 2)
-        self.assertEqual(copy_calls[0][0][0], "test text")
-        self.assertEqual(copy_calls[1][0][0], "original")
+        assert len(copy_calls) == 2
+        assert copy_calls[0][0][0] == "test text"
+        assert copy_calls[1][0][0] == "original"
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
     @patch('context_aware_whisper.platform.macos.output_handler.subprocess.run')
@@ -363,10 +357,10 @@ class TestBaseOutputMethodUsesInstant(unittest.TestCase):
         handler.output("test2", use_paste=True)
 
         # Both calls should use instant paste (2 paste attempts + 4 copy calls total)
-        self.assertEqual(mock_run.call_count, 2)
+        assert mock_run.call_count == 2
 
 
-class TestClipboardRestoreEdgeCases(unittest.TestCase):
+class TestClipboardRestoreEdgeCases:
     """Test edge cases for clipboard restoration."""
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
@@ -382,7 +376,7 @@ class TestClipboardRestoreEdgeCases(unittest.TestCase):
         handler.type_text_instant("new text")
 
         # Should only copy the new text, not try to restore
-        self.assertEqual(mock_pyperclip.copy.call_count, 1)
+        assert mock_pyperclip.copy.call_count == 1
         mock_pyperclip.copy.assert_called_with("new text")
 
     @patch('context_aware_whisper.platform.macos.output_handler.pyperclip')
@@ -419,7 +413,3 @@ class TestClipboardRestoreEdgeCases(unittest.TestCase):
 
         # Check that the special text was copied to clipboard
         mock_pyperclip.copy.assert_any_call(special_text)
-
-
-if __name__ == '__main__':
-    unittest.main()